@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the PDF report engine for growing meeting sizes.
+Renders a synthetic meeting (10 polls, 5 scrutators) with 100, 1,000 and 10,000
+approved participants and prints render time, peak Python memory and PDF size.
+
+Usage: python report_benchmark.py [participants ...]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+# server.py lit la configuration MongoDB à l'import ; aucune connexion n'est ouverte ici
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'vote_secret_benchmark')
+
+from server import generate_pdf_report  # noqa: E402
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+def build_meeting(participant_count: int):
+    started = datetime.utcnow()
+    meeting = {
+        "id": str(uuid.uuid4()),
+        "title": f"Assemblée générale ({participant_count} participants)",
+        "organizer_name": "Organisateur",
+        "meeting_code": "BENCH001",
+        "organizer_timezone": "Europe/Paris",
+        "created_at": started
+    }
+    participants = (
+        {
+            "name": f"Participant {i:05d}",
+            "joined_at": started + timedelta(seconds=i),
+            "approval_status": "approved"
+        }
+        for i in range(participant_count)
+    )
+    scrutators = [
+        {"name": f"Scrutateur {i}", "added_at": started}
+        for i in range(5)
+    ]
+    polls = [
+        {
+            "question": f"Résolution n°{p + 1}",
+            "options": [
+                {"text": text, "votes": participant_count // 3}
+                for text in ("Pour", "Contre", "Abstention")
+            ]
+        }
+        for p in range(10)
+    ]
+    return meeting, participants, polls, scrutators
+
+def run(participant_count: int):
+    meeting, participants, polls, scrutators = build_meeting(participant_count)
+    tracemalloc.start()
+    started = time.perf_counter()
+    pdf = generate_pdf_report(meeting, participants, polls, scrutators)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(pdf)
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'Participants':>12} | {'Temps (s)':>9} | {'ms/100 part.':>12} | {'Mémoire max (Mo)':>16} | {'PDF (Ko)':>8}")
+    print("-" * 72)
+    for size in sizes:
+        elapsed, peak, pdf_size = run(size)
+        print(
+            f"{size:>12} | {elapsed:>9.2f} | {elapsed * 1000 * 100 / size:>12.1f} | "
+            f"{peak / 1024 / 1024:>16.1f} | {pdf_size / 1024:>8.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
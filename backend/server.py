@@ -1,10 +1,13 @@
-from fastapi import FastAPI, APIRouter, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import CursorType, ReturnDocument
+from pymongo.errors import CollectionInvalid, DuplicateKeyError, OperationFailure
 import os
+import socket
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -12,8 +15,16 @@ from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
-import json
-import tempfile
+from collections import OrderedDict, deque
+import copy
+from contextlib import contextmanager
+from abc import ABC, abstractmethod
+import orjson
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import time
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -22,10 +33,6 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import pytz  # Pour la gestion des fuseaux horaires
 
-# Global lock for vote operations
-vote_locks = {}
-lock_manager = asyncio.Lock()
-
 # Timezone utility functions
 def convert_utc_to_organizer_timezone(utc_datetime: datetime, organizer_timezone: str) -> datetime:
     """Convert UTC datetime to organizer's timezone"""
@@ -72,8 +79,186 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, uuidRepresentation='standard')
+
+# Stockage des identifiants d'entité : "field" (champ `id` texte à côté de `_id`) ou
+# "primary_key" (l'id est le `_id`, en UUID binaire). L'API expose toujours des id texte.
+# Le mode primary_key s'applique à une base neuve : les documents existants ne sont pas migrés.
+ENTITY_ID_STORAGE = os.environ.get('ENTITY_ID_STORAGE', 'field').lower()
+ENTITY_COLLECTIONS = {"meetings", "participants", "polls", "votes", "scrutators"}
+
+def _storage_id(value: Any) -> Any:
+    """UUID texte -> UUID (stocké en binaire) ; toute autre valeur est laissée telle quelle"""
+    if isinstance(value, str):
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return value
+    return value
+
+def entity_filter(query: dict) -> dict:
+    """Traduire un filtre sur `id` vers `_id` en mode primary_key"""
+    if ENTITY_ID_STORAGE != "primary_key" or "id" not in query:
+        return query
+    query = dict(query)
+    value = query.pop("id")
+    if isinstance(value, dict):
+        value = {
+            op: [_storage_id(v) for v in arg] if isinstance(arg, list) else _storage_id(arg)
+            for op, arg in value.items()
+        }
+    else:
+        value = _storage_id(value)
+    query["_id"] = value
+    return query
+
+def to_storage(document: dict) -> dict:
+    document = dict(document)
+    if "id" in document:
+        document["_id"] = _storage_id(document.pop("id"))
+    return document
+
+def from_storage(document: Optional[dict]) -> Optional[dict]:
+    if document is not None and "_id" in document:
+        document["id"] = str(document.pop("_id"))
+    return document
+
+class EntityCursor:
+    """Curseur dont les documents sont rendus avec leur `id` texte"""
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+    
+    def sort(self, *args, **kwargs):
+        self._cursor.sort(*args, **kwargs)
+        return self
+    
+    def limit(self, *args, **kwargs):
+        self._cursor.limit(*args, **kwargs)
+        return self
+    
+    async def to_list(self, length=None):
+        return [from_storage(document) for document in await self._cursor.to_list(length)]
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        return from_storage(await self._cursor.__anext__())
+
+class EntityCollection:
+    """Collection d'entités stockant l'id dans `_id` : filtres et documents sont traduits"""
+    
+    def __init__(self, collection):
+        self._collection = collection
+    
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+    
+    async def find_one(self, filter: Optional[dict] = None, *args, **kwargs):
+        return from_storage(await self._collection.find_one(entity_filter(filter or {}), *args, **kwargs))
+    
+    def find(self, filter: Optional[dict] = None, *args, **kwargs) -> EntityCursor:
+        return EntityCursor(self._collection.find(entity_filter(filter or {}), *args, **kwargs))
+    
+    async def find_one_and_update(self, filter: dict, *args, **kwargs):
+        return from_storage(await self._collection.find_one_and_update(entity_filter(filter), *args, **kwargs))
+    
+    async def insert_one(self, document: dict, *args, **kwargs):
+        return await self._collection.insert_one(to_storage(document), *args, **kwargs)
+    
+    async def insert_many(self, documents: List[dict], *args, **kwargs):
+        return await self._collection.insert_many([to_storage(d) for d in documents], *args, **kwargs)
+    
+    async def update_one(self, filter: dict, *args, **kwargs):
+        return await self._collection.update_one(entity_filter(filter), *args, **kwargs)
+    
+    async def update_many(self, filter: dict, *args, **kwargs):
+        return await self._collection.update_many(entity_filter(filter), *args, **kwargs)
+    
+    async def delete_one(self, filter: dict, *args, **kwargs):
+        return await self._collection.delete_one(entity_filter(filter), *args, **kwargs)
+    
+    async def delete_many(self, filter: dict, *args, **kwargs):
+        return await self._collection.delete_many(entity_filter(filter), *args, **kwargs)
+    
+    async def count_documents(self, filter: dict, *args, **kwargs):
+        return await self._collection.count_documents(entity_filter(filter), *args, **kwargs)
+
+class EntityDatabase:
+    """Base dont les collections d'entités passent par `EntityCollection`"""
+    
+    def __init__(self, database):
+        self._database = database
+        self._entities = {name: EntityCollection(database[name]) for name in ENTITY_COLLECTIONS}
+    
+    def __getattr__(self, name):
+        if name in ENTITY_COLLECTIONS:
+            return self._entities[name]
+        return getattr(self._database, name)
+    
+    def __getitem__(self, name):
+        if name in ENTITY_COLLECTIONS:
+            return self._entities[name]
+        return self._database[name]
+
 db = client[os.environ['DB_NAME']]
+if ENTITY_ID_STORAGE == "primary_key":
+    db = EntityDatabase(db)
+
+# Index requis par les requêtes de l'application : (collection, clés, options).
+# Ils sont créés au démarrage ; la création est idempotente et un index déjà
+# présent (ex. créé par mongo-init.js) avec les mêmes clés est conservé.
+REQUIRED_INDEXES = [
+    ("meetings", [("id", 1)], {"unique": True}),
+    ("meetings", [("meeting_code", 1)], {"unique": True}),
+    ("meetings", [("scrutator_code", 1)], {}),
+    ("meetings", [("status", 1)], {}),
+    ("participants", [("id", 1)], {"unique": True}),
+    ("participants", [("meeting_id", 1), ("name", 1)], {"unique": True}),
+    ("participants", [("meeting_id", 1), ("revision", 1)], {}),
+    ("polls", [("id", 1)], {"unique": True}),
+    ("polls", [("meeting_id", 1), ("revision", 1)], {}),
+    ("votes", [("poll_id", 1)], {}),
+    ("scrutators", [("id", 1)], {"unique": True}),
+    ("scrutators", [("meeting_id", 1), ("name", 1)], {"unique": True}),
+    ("recovery_sessions", [("recovery_code", 1)], {"unique": True}),
+    ("recovery_sessions", [("meeting_id", 1)], {}),
+]
+if ENTITY_ID_STORAGE == "primary_key":
+    # L'index `_id` sert déjà les recherches par id
+    REQUIRED_INDEXES = [
+        (collection, keys, options) for collection, keys, options in REQUIRED_INDEXES
+        if not (collection in ENTITY_COLLECTIONS and keys == [("id", 1)])
+    ]
+
+async def find_missing_indexes() -> List[str]:
+    """Lister les index requis absents de la base (comparaison sur les clés)"""
+    existing = {}
+    missing = []
+    for collection, keys, _ in REQUIRED_INDEXES:
+        if collection not in existing:
+            existing[collection] = [info["key"] for info in (await db[collection].index_information()).values()]
+        if keys not in existing[collection]:
+            missing.append(f"{collection}({', '.join(field for field, _ in keys)})")
+    return missing
+
+async def ensure_required_indexes() -> List[str]:
+    """Créer les index requis puis renvoyer ceux qui manquent encore"""
+    for collection, keys, options in REQUIRED_INDEXES:
+        existing = await db[collection].index_information()
+        if any(info["key"] == keys for info in existing.values()):
+            continue
+        try:
+            await db[collection].create_index(keys, **options)
+        except OperationFailure as e:
+            # Ex. doublons existants empêchant un index unique : l'application démarre quand même
+            logger.error(f"Could not create index on {collection} {keys}: {str(e)}")
+    
+    missing = await find_missing_indexes()
+    if missing:
+        logger.warning(f"Missing database indexes: {', '.join(missing)}")
+    return missing
 
 # Create the main app without a prefix
 app = FastAPI()
@@ -81,30 +266,554 @@ app = FastAPI()
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# WebSocket connection manager
-class ConnectionManager:
+# Multi-worker coordination
+# Plusieurs workers uvicorn (ou conteneurs) peuvent servir la même base : tout état
+# qui doit être partagé passe par MongoDB.
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', '1'))
+CLUSTER_MODE = (os.environ.get('CLUSTER_MODE') or ('true' if WEB_CONCURRENCY > 1 else 'false')).lower() == 'true'
+WORKER_HEARTBEAT_SECONDS = 15
+WS_BROKER = os.environ.get('WS_BROKER') or ('capped' if CLUSTER_MODE else 'memory')
+WS_EVENTS_CAPPED_BYTES = int(os.environ.get('WS_EVENTS_CAPPED_BYTES', str(32 * 1024 * 1024)))
+WS_EVENTS_TTL_SECONDS = int(os.environ.get('WS_EVENTS_TTL_SECONDS', '300'))
+WS_SEND_TIMEOUT_SECONDS = float(os.environ.get('WS_SEND_TIMEOUT_SECONDS', '2'))
+WS_PING_INTERVAL_SECONDS = float(os.environ.get('WS_PING_INTERVAL_SECONDS', '20'))
+WS_PING_TIMEOUT_SECONDS = float(os.environ.get('WS_PING_TIMEOUT_SECONDS', '20'))
+WS_QUEUE_MAX_FRAMES = int(os.environ.get('WS_QUEUE_MAX_FRAMES', '100'))
+WS_OVERFLOW_POLICY = os.environ.get('WS_OVERFLOW_POLICY', 'merge_tally')  # merge_tally | disconnect
+# Mises à jour de décompte qu'une file saturée peut fusionner : elles ne portent que les
+# options modifiées, deux mises à jour d'un même sondage se combinent donc sans perte
+MERGEABLE_EVENT_TYPES = {"vote_submitted"}
+WS_EVENT_LOG_TTL_SECONDS = int(os.environ.get('WS_EVENT_LOG_TTL_SECONDS', '600'))
+# Délai minimal d'un long-poll avant qu'une simple mise à jour de décompte ne le libère
+LONG_POLL_TALLY_HOLD_SECONDS = float(os.environ.get('LONG_POLL_TALLY_HOLD_SECONDS', '5'))
+background_tasks: List[asyncio.Task] = []
+
+async def acquire_lease(name: str, ttl_seconds: int) -> bool:
+    """Obtenir ou renouveler un bail exclusif partagé entre tous les workers"""
+    now = datetime.utcnow()
+    try:
+        await db.background_leases.find_one_and_update(
+            {"_id": name, "$or": [{"holder": WORKER_ID}, {"expires_at": {"$lt": now}}]},
+            {"$set": {"holder": WORKER_ID, "expires_at": now + timedelta(seconds=ttl_seconds)}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        # Un autre worker détient un bail encore valide
+        return False
+
+def _json_default(value: Any):
+    """Types non natifs pour orjson (ObjectId, Decimal...) : représentation texte"""
+    return str(value)
+
+def encode_ws_message(message: dict) -> str:
+    """Encoder un événement WebSocket en JSON.
+    
+    Les datetime (naïfs, en UTC) sont écrits au format ISO 8601 sans fuseau, comme
+    dans les réponses REST ; les énumérations sont écrites par leur valeur.
+    """
+    return orjson.dumps(message, default=_json_default).decode()
+
+PING_FRAME = encode_ws_message({"type": "ping"})
+
+# Role-scoped channels
+# Le rôle est déclaré par le client (paramètre `role` du WebSocket) et n'est pas vérifié :
+# ce routage évite d'envoyer aux participants un trafic qui ne les concerne pas, il ne
+# protège aucune donnée. L'API REST, elle aussi sans authentification, expose déjà ces
+# informations (vue organisateur, résultats détaillés des sondages).
+STAFF_ROLES = {"organizer", "scrutator"}
+# Événements réservés à l'organisateur et aux scrutateurs
+STAFF_ONLY_EVENT_TYPES = {
+    "participant_joined",
+    "participant_approved",
+    "scrutator_joined",
+    "scrutator_approved",
+    "scrutator_vote_submitted",
+    "report_generation_approved",
+    "report_generation_rejected",
+    "leadership_transferred"
+}
+
+def merge_tallies(older: dict, newer: dict) -> dict:
+    """Combiner deux mises à jour de décompte d'un même sondage (la plus récente prime)"""
+    merged = {**older, **newer}
+    if "options" in older or "options" in newer:
+        options = {option["id"]: option for option in older.get("options", [])}
+        options.update({option["id"]: option for option in newer.get("options", [])})
+        merged["options"] = list(options.values())
+    return merged
+
+def payload_for_role(message: dict, role: str) -> Optional[dict]:
+    """Version d'un événement destinée à un rôle, ou None s'il ne doit pas la recevoir"""
+    if role in STAFF_ROLES:
+        return message
+    if message.get("type") in STAFF_ONLY_EVENT_TYPES:
+        return None
+    if message.get("type") == "vote_submitted":
+        # Les participants ne voient que le total tant que le sondage est ouvert
+        return {key: message[key] for key in ("type", "poll_id", "total_votes", "seq") if key in message}
+    return message
+
+def tally_payload(payload: dict) -> Optional[dict]:
+    """La charge utile si c'est une mise à jour de décompte fusionnable, sinon None"""
+    return payload if payload.get("type") in MERGEABLE_EVENT_TYPES else None
+
+# WebSocket pub/sub brokers
+# Un broadcast est publié sur le broker ; chaque worker abonné le remet ensuite à ses
+# propres sockets pour la réunion concernée.
+class MessageBroker(ABC):
+    """Interface commune des brokers de diffusion des événements de réunion"""
+    
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        self._deliver = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self, deliver):
+        """Démarrer l'abonnement ; `deliver(message, meeting_id)` reçoit chaque événement"""
+        self._deliver = deliver
+    
+    @abstractmethod
+    async def publish(self, message: dict, meeting_id: str):
+        """Diffuser un événement à tous les workers abonnés"""
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+class InMemoryBroker(MessageBroker):
+    """Diffusion limitée au processus courant (un seul worker)"""
+    
+    async def publish(self, message: dict, meeting_id: str):
+        await self._deliver(message, meeting_id)
+
+class MongoCappedBroker(MessageBroker):
+    """Diffusion via une collection plafonnée lue par curseur tailable (pas de replica set requis)"""
+    
+    async def start(self, deliver):
+        await super().start(deliver)
+        try:
+            await db.create_collection("ws_events", capped=True, size=WS_EVENTS_CAPPED_BYTES)
+        except CollectionInvalid:
+            pass  # Collection déjà créée par un autre worker
+        self._task = asyncio.create_task(self._relay())
+    
+    async def publish(self, message: dict, meeting_id: str):
+        await db.ws_events.insert_one({
+            "meeting_id": meeting_id,
+            "message": message,
+            "origin": WORKER_ID,
+            "ts": datetime.utcnow()
+        })
+    
+    async def _relay(self):
+        last_ts = datetime.utcnow()
+        while True:
+            try:
+                cursor = db.ws_events.find({"ts": {"$gt": last_ts}}, cursor_type=CursorType.TAILABLE_AWAIT)
+                while cursor.alive:
+                    async for event in cursor:
+                        last_ts = event["ts"]
+                        await self._deliver(event["message"], event["meeting_id"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error relaying capped-collection events: {str(e)}")
+            # Le curseur se ferme tant que la collection est vide : réessayer
+            await asyncio.sleep(1)
+
+class MongoChangeStreamBroker(MessageBroker):
+    """Diffusion via un change stream MongoDB (replica set requis, même à un seul nœud)"""
+    
+    async def start(self, deliver):
+        await super().start(deliver)
+        # Les événements ne servent qu'à la diffusion : les laisser expirer
+        await db.ws_stream_events.create_index("ts", expireAfterSeconds=WS_EVENTS_TTL_SECONDS)
+        self._task = asyncio.create_task(self._relay())
+    
+    async def publish(self, message: dict, meeting_id: str):
+        await db.ws_stream_events.insert_one({
+            "meeting_id": meeting_id,
+            "message": message,
+            "origin": WORKER_ID,
+            "ts": datetime.utcnow()
+        })
+    
+    async def _relay(self):
+        resume_token = None
+        while True:
+            try:
+                async with db.ws_stream_events.watch(
+                    [{"$match": {"operationType": "insert"}}],
+                    resume_after=resume_token
+                ) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        event = change["fullDocument"]
+                        await self._deliver(event["message"], event["meeting_id"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error relaying change-stream events: {str(e)}")
+                await asyncio.sleep(1)
+
+def create_broker(name: str) -> MessageBroker:
+    brokers = {
+        "memory": InMemoryBroker,
+        "capped": MongoCappedBroker,
+        "changestream": MongoChangeStreamBroker
+    }
+    if name not in brokers:
+        raise ValueError(f"Unknown WS_BROKER '{name}', expected one of: {', '.join(brokers)}")
+    return brokers[name]()
+
+# Sequenced meeting events
+class MeetingEventLog:
+    """Numéroter les événements de chaque réunion et en garder un journal court.
+    
+    Chaque événement reçoit un numéro `seq` croissant par réunion, partagé entre tous
+    les workers. Un client qui se reconnecte avec son dernier `seq` ne reçoit que ce
+    qu'il a manqué, tant que le journal (WS_EVENT_LOG_TTL_SECONDS) le couvre.
+    """
+    
+    async def ensure_indexes(self):
+        await db.meeting_events.create_index([("meeting_id", 1), ("seq", 1)])
+        await db.meeting_events.create_index("ts", expireAfterSeconds=WS_EVENT_LOG_TTL_SECONDS)
+        await db.meeting_sequences.create_index("updated_at", expireAfterSeconds=86400)
+    
+    async def record(self, message: dict, meeting_id: str) -> dict:
+        """Attribuer le prochain numéro à un événement et l'ajouter au journal"""
+        now = datetime.utcnow()
+        counter = await db.meeting_sequences.find_one_and_update(
+            {"_id": meeting_id},
+            {"$inc": {"seq": 1}, "$set": {"updated_at": now}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        sequenced = {**message, "seq": counter["seq"]}
+        await db.meeting_events.insert_one({
+            "meeting_id": meeting_id,
+            "seq": counter["seq"],
+            "message": sequenced,
+            "ts": now
+        })
+        return sequenced
+    
+    async def current_seq(self, meeting_id: str) -> int:
+        counter = await db.meeting_sequences.find_one({"_id": meeting_id})
+        return counter["seq"] if counter else 0
+    
+    async def since(self, meeting_id: str, last_seq: int, limit: int) -> Optional[List[dict]]:
+        """Événements postérieurs à `last_seq`, ou None si le journal ne les couvre plus
+        ou s'ils sont plus de `limit` (une reprise aussi longue se fait par resynchronisation)"""
+        current = await self.current_seq(meeting_id)
+        if last_seq > current or current - last_seq > limit:
+            return None
+        
+        events = await db.meeting_events.find(
+            {"meeting_id": meeting_id, "seq": {"$gt": last_seq}}
+        ).sort("seq", 1).limit(limit + 1).to_list(None)
+        if len(events) > limit:
+            return None
+        
+        expected = last_seq + 1
+        for event in events:
+            if event["seq"] != expected:
+                return None
+            expected += 1
+        if expected <= current:
+            return None
+        return [event["message"] for event in events]
+    
+    async def forget(self, meeting_id: str):
+        await db.meeting_events.delete_many({"meeting_id": meeting_id})
+        await db.meeting_sequences.delete_one({"_id": meeting_id})
+
+meeting_events = MeetingEventLog()
+
+# WebSocket connection manager
+class ClientConnection:
+    """Socket d'un client avec sa file d'envoi bornée, vidée par sa propre tâche d'écriture"""
+    
+    def __init__(self, websocket: WebSocket, role: str, stats: Dict[str, int], on_dead):
+        self.websocket = websocket
+        self.role = role
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self._stats = stats
+        self._on_dead = on_dead
+        self._frames: deque = deque()  # (trame, décompte fusionnable ou None)
+        # Diffusions reçues pendant la reprise, retenues jusqu'à `release` : (seq, trame, décompte)
+        self._held: Optional[List[tuple]] = []
+        self._ready = asyncio.Event()
+        self._writer = asyncio.create_task(self._write_loop())
+    
+    @property
+    def depth(self) -> int:
+        return len(self._frames)
+    
+    def mark_seen(self):
+        """Le client a envoyé un message (pong ou autre) : il est vivant"""
+        self.last_seen = time.monotonic()
+    
+    def enqueue(self, frame: str, tally: Optional[dict] = None) -> bool:
+        """Mettre une trame en file ; retourne False si le client doit être déconnecté.
+        
+        `tally` est la charge utile d'une mise à jour de décompte : file saturée, elle
+        absorbe la précédente mise à jour en attente du même sondage.
+        """
+        if self.closed:
+            return True
+        if len(self._frames) >= WS_QUEUE_MAX_FRAMES:
+            if WS_OVERFLOW_POLICY == "disconnect":
+                return False
+            queued = self._take_tally(tally["poll_id"]) if tally is not None else None
+            if queued is not None:
+                tally = merge_tallies(queued, tally)
+                frame = encode_ws_message(tally)
+            elif not self._merge_oldest_tally():
+                # Aucune fusion possible : rien ne peut être perdu, le client se reconnectera
+                return False
+        self._frames.append((frame, tally))
+        self._ready.set()
+        return True
+    
+    def deliver(self, seq: Optional[int], frame: str, tally: Optional[dict] = None) -> bool:
+        """Remettre une diffusion : retenue tant que la reprise n'est pas terminée"""
+        if self._held is not None:
+            self._held.append((seq, frame, tally))
+            return True
+        return self.enqueue(frame, tally)
+    
+    def release(self, replayed_seq: Optional[int]) -> bool:
+        """Fin de la reprise : mettre en file les diffusions retenues que la reprise n'a pas couvertes"""
+        held, self._held = self._held or [], None
+        for seq, frame, tally in held:
+            if replayed_seq is not None and seq is not None and seq <= replayed_seq:
+                continue
+            if not self.enqueue(frame, tally):
+                return False
+        return True
+    
+    def _take_tally(self, poll_id: str) -> Optional[dict]:
+        """Retirer de la file la dernière mise à jour de décompte d'un sondage"""
+        for i in range(len(self._frames) - 1, -1, -1):
+            tally = self._frames[i][1]
+            if tally is not None and tally.get("poll_id") == poll_id:
+                del self._frames[i]
+                self._stats["frames_merged"] += 1
+                return tally
+        return None
+    
+    def _merge_oldest_tally(self) -> bool:
+        """Fusionner la plus ancienne mise à jour de décompte dans la suivante du même sondage"""
+        for i, (_, older) in enumerate(self._frames):
+            if older is None:
+                continue
+            for j in range(i + 1, len(self._frames)):
+                newer = self._frames[j][1]
+                if newer is not None and newer.get("poll_id") == older.get("poll_id"):
+                    merged = merge_tallies(older, newer)
+                    self._frames[j] = (encode_ws_message(merged), merged)
+                    del self._frames[i]
+                    self._stats["frames_merged"] += 1
+                    return True
+        return False
+    
+    async def _write_loop(self):
+        while True:
+            while not self._frames:
+                self._ready.clear()
+                await self._ready.wait()
+            frame, _ = self._frames.popleft()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(frame), timeout=WS_SEND_TIMEOUT_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Socket inutilisable : la retirer immédiatement des diffusions
+                self.closed = True
+                self._frames.clear()
+                self._on_dead(self)
+                return
+    
+    def stop(self):
+        self.closed = True
+        self._frames.clear()
+        self._writer.cancel()
+    
+    async def close(self, code: int = 1000):
+        self.stop()
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code), timeout=WS_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+# Événements qui modifient ce qu'un participant en attente doit afficher
+LONG_POLL_WAKE_EVENT_TYPES = {"poll_started", "poll_closed", "meeting_closed", "meeting_auto_deleted"}
+
+class LongPollWaiter:
+    """Attente long-poll d'un participant sur une réunion.
+    
+    Seuls le cycle de vie des sondages, la fin de la réunion et la validation de ce
+    participant la libèrent aussitôt ; l'arrivée ou la validation des autres est ignorée.
+    Les mises à jour de décompte n'agissent qu'une fois `LONG_POLL_TALLY_HOLD_SECONDS`
+    écoulées depuis le début de l'attente, ce qui borne le rythme des réponses pendant un vote.
+    """
+    
+    def __init__(self, participant_id: Optional[str], hold_seconds: float):
+        self.participant_id = participant_id
+        self.changed = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._hold_until = self._loop.time() + hold_seconds
+        self._timer: Optional[asyncio.TimerHandle] = None
+    
+    def notify(self, message: dict):
+        event_type = message.get("type")
+        if event_type in LONG_POLL_WAKE_EVENT_TYPES or (
+            event_type == "participant_approved" and message.get("participant_id") == self.participant_id
+        ):
+            self.changed.set()
+            return
+        if event_type not in MERGEABLE_EVENT_TYPES:
+            return
+        delay = self._hold_until - self._loop.time()
+        if delay <= 0:
+            self.changed.set()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(delay, self.changed.set)
+    
+    def cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
 
-    async def connect(self, websocket: WebSocket, meeting_id: str):
+class ConnectionManager:
+    def __init__(self, broker: MessageBroker):
+        self.active_connections: Dict[str, List[ClientConnection]] = {}
+        self.broker = broker
+        self._pending_broadcasts: Dict[str, asyncio.Task] = {}
+        self._watchers: Dict[str, set] = {}  # meeting_id -> {LongPollWaiter}
+        self.stats = {"frames_merged": 0, "clients_evicted": 0, "clients_reaped": 0}
+
+    async def connect(self, websocket: WebSocket, meeting_id: str, role: str = "participant") -> ClientConnection:
         await websocket.accept()
+        connection = ClientConnection(websocket, role, self.stats, lambda c: self._reap(c, meeting_id))
         if meeting_id not in self.active_connections:
             self.active_connections[meeting_id] = []
-        self.active_connections[meeting_id].append(websocket)
-
-    def disconnect(self, websocket: WebSocket, meeting_id: str):
-        if meeting_id in self.active_connections:
-            self.active_connections[meeting_id].remove(websocket)
+        self.active_connections[meeting_id].append(connection)
+        return connection
+
+    def disconnect(self, connection: ClientConnection, meeting_id: str):
+        connection.stop()
+        connections = self.active_connections.get(meeting_id)
+        if connections is not None:
+            if connection in connections:
+                connections.remove(connection)
+            # Ne pas garder d'entrée pour une réunion sans socket
+            if not connections:
+                del self.active_connections[meeting_id]
+
+    def _reap(self, connection: ClientConnection, meeting_id: str):
+        """Retirer une socket morte (envoi échoué ou pong manquant) et la fermer"""
+        self.stats["clients_reaped"] += 1
+        self.disconnect(connection, meeting_id)
+        asyncio.create_task(connection.close(code=1001))
+
+    async def keepalive(self):
+        """Envoyer un ping applicatif et retirer les sockets qui n'ont pas répondu à temps"""
+        while True:
+            await asyncio.sleep(WS_PING_INTERVAL_SECONDS)
+            deadline = time.monotonic() - (WS_PING_INTERVAL_SECONDS + WS_PING_TIMEOUT_SECONDS)
+            for meeting_id, connections in list(self.active_connections.items()):
+                for connection in list(connections):
+                    if connection.last_seen < deadline:
+                        self._reap(connection, meeting_id)
+                    elif not connection.enqueue(PING_FRAME):
+                        await self.evict(connection, meeting_id)
 
     async def send_to_meeting(self, message: dict, meeting_id: str):
-        if meeting_id in self.active_connections:
-            for connection in self.active_connections[meeting_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except:
-                    pass
+        """Publier un événement sans attendre sa remise aux sockets.
+        
+        La diffusion tourne en tâche de fond : la requête HTTP qui l'a déclenchée répond
+        immédiatement. Les événements d'une même réunion restent remis dans l'ordre.
+        """
+        previous = self._pending_broadcasts.get(meeting_id)
+        task = asyncio.create_task(self._publish_after(previous, message, meeting_id))
+        self._pending_broadcasts[meeting_id] = task
+        task.add_done_callback(lambda t: self._broadcast_done(t, meeting_id))
+
+    async def _publish_after(self, previous: Optional[asyncio.Task], message: dict, meeting_id: str):
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            message = await meeting_events.record(message, meeting_id)
+            await self.broker.publish(message, meeting_id)
+        except Exception as e:
+            logger.error(f"Error broadcasting {message.get('type')} to meeting {meeting_id}: {str(e)}")
+
+    def _broadcast_done(self, task: asyncio.Task, meeting_id: str):
+        if self._pending_broadcasts.get(meeting_id) is task:
+            del self._pending_broadcasts[meeting_id]
+
+    async def drain(self, timeout: float = 5):
+        """Attendre la fin des diffusions en cours (arrêt du serveur)"""
+        pending = list(self._pending_broadcasts.values())
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+
+    @contextmanager
+    def watch(self, meeting_id: str, participant_id: Optional[str] = None):
+        """Attente levée par les notifications d'une réunion qui concernent ce participant (long-poll)"""
+        waiter = LongPollWaiter(participant_id, LONG_POLL_TALLY_HOLD_SECONDS)
+        self._watchers.setdefault(meeting_id, set()).add(waiter)
+        try:
+            yield waiter.changed
+        finally:
+            waiter.cancel()
+            watchers = self._watchers.get(meeting_id)
+            if watchers is not None:
+                watchers.discard(waiter)
+                if not watchers:
+                    del self._watchers[meeting_id]
+
+    async def deliver_local(self, message: dict, meeting_id: str):
+        for waiter in self._watchers.get(meeting_id, ()):
+            waiter.notify(message)
+        
+        connections = list(self.active_connections.get(meeting_id, []))
+        if connections:
+            # Encodé une seule fois par rôle, la même trame est partagée par toutes ses sockets
+            frames: Dict[str, tuple] = {}
+            for role in {connection.role for connection in connections}:
+                payload = payload_for_role(message, role)
+                frames[role] = (encode_ws_message(payload), tally_payload(payload)) if payload is not None else None
+            # Mise en file sans attente : chaque socket est écrite par sa propre tâche
+            for connection in connections:
+                frame = frames[connection.role]
+                if frame is not None and not connection.deliver(message.get("seq"), *frame):
+                    await self.evict(connection, meeting_id)
+
+    async def evict(self, connection: ClientConnection, meeting_id: str):
+        """Déconnecter un client trop lent dont la file est saturée"""
+        self.stats["clients_evicted"] += 1
+        self.disconnect(connection, meeting_id)
+        # 1013 "Try Again Later" : le client peut se reconnecter avec son dernier seq
+        asyncio.create_task(connection.close(code=1013))
+
+    def metrics(self) -> Dict[str, Any]:
+        connections = [c for conns in self.active_connections.values() for c in conns]
+        return {
+            "meetings": len(self.active_connections),
+            "connections": len(connections),
+            "long_poll_waiters": sum(len(w) for w in self._watchers.values()),
+            "overflow_policy": WS_OVERFLOW_POLICY,
+            "queue_max_frames": WS_QUEUE_MAX_FRAMES,
+            "queued_frames": sum(c.depth for c in connections),
+            "max_queue_depth": max((c.depth for c in connections), default=0),
+            **self.stats
+        }
 
-manager = ConnectionManager()
+manager = ConnectionManager(create_broker(WS_BROKER))
 
 # Enums
 class ParticipantStatus(str, Enum):
@@ -121,6 +830,11 @@ class MeetingStatus(str, Enum):
     ACTIVE = "active"
     COMPLETED = "completed"
 
+class ClientRole(str, Enum):
+    ORGANIZER = "organizer"
+    SCRUTATOR = "scrutator"
+    PARTICIPANT = "participant"
+
 # Models
 class ScrutatorStatus(str, Enum):
     PENDING = "pending"
@@ -167,6 +881,8 @@ class Meeting(BaseModel):
     leadership_transferred_to: Optional[str] = None  # Nom du scrutateur ayant reçu le leadership
     auto_deletion_scheduled: Optional[datetime] = None  # Suppression automatique programmée
     status: MeetingStatus = MeetingStatus.ACTIVE
+    revision: int = 0  # Incrémenté à chaque changement visible (participants, sondages, décomptes)
+    poll_revision: int = 0  # Incrémenté uniquement quand la vue des sondages change
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 class MeetingCreate(BaseModel):
@@ -235,6 +951,174 @@ class VoteCreate(BaseModel):
     poll_id: str
     option_id: str
 
+# Meeting document cache
+class MeetingCache:
+    """Cache en mémoire (par processus) des documents de réunion, par id et par code.
+    
+    Chaque écriture sur une réunion appelle `invalidate` ; le TTL borne l'écart entre
+    workers, dont les invalidations restent locales. Les lectures concurrentes d'une
+    même clé absente partagent une seule requête (ruée sur un code de réunion).
+    Les endpoints qui comparent la révision (ETag, /changes, long-poll) lisent la base :
+    un simple changement de révision (arrivée d'un participant, diffusion des votes)
+    met à jour le document en cache sans l'invalider.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, tuple] = {}  # clé -> (expiration, document)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Réunions invalidées pendant des lectures en cours : meeting_id -> horloge
+        self._invalidated: Dict[str, int] = {}
+        self._clock = 0
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+    
+    async def get(self, meeting_id: str) -> Optional[dict]:
+        return await self._get(f"id:{meeting_id}", {"id": meeting_id})
+    
+    async def get_active_by_code(self, meeting_code: str) -> Optional[dict]:
+        meeting = await self._get(f"code:{meeting_code}", {"meeting_code": meeting_code, "status": "active"})
+        return meeting if meeting and meeting.get("status") == "active" else None
+    
+    async def get_active_by_scrutator_code(self, scrutator_code: str) -> Optional[dict]:
+        meeting = await self._get(f"scrutator:{scrutator_code}", {"scrutator_code": scrutator_code, "status": "active"})
+        return meeting if meeting and meeting.get("status") == "active" else None
+    
+    async def _get(self, key: str, query: dict) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.stats["hits"] += 1
+            return copy.deepcopy(entry[1])
+        
+        future = self._inflight.get(key)
+        if future is None:
+            self.stats["misses"] += 1
+            future = asyncio.ensure_future(self._load(query))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._load_done(key, done))
+        else:
+            self.stats["coalesced"] += 1
+        meeting = await asyncio.shield(future)
+        return copy.deepcopy(meeting) if meeting else None
+    
+    async def _load(self, query: dict) -> Optional[dict]:
+        for _ in range(3):
+            started = self._clock
+            meeting = await db.meetings.find_one(query)
+            if not meeting or self._invalidated.get(meeting["id"], 0) <= started:
+                if meeting:
+                    self._store(meeting)
+                return meeting
+            # Réunion modifiée pendant la lecture : relire, les appelants qui ont
+            # rejoint cette lecture après l'écriture ne doivent pas la voir périmée
+        return meeting
+    
+    def _load_done(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not self._inflight:
+            self._invalidated.clear()
+    
+    def _store(self, meeting: dict):
+        if len(self._entries) >= self.max_entries:
+            now = time.monotonic()
+            self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+        entry = (time.monotonic() + self.ttl, meeting)
+        for key in self._keys(meeting):
+            self._entries[key] = entry
+    
+    @staticmethod
+    def _keys(meeting: dict) -> List[str]:
+        keys = [f"id:{meeting['id']}", f"code:{meeting['meeting_code']}"]
+        if meeting.get("scrutator_code"):
+            keys.append(f"scrutator:{meeting['scrutator_code']}")
+        return keys
+    
+    def invalidate(self, meeting_id: str):
+        """Oublier une réunion après toute écriture la concernant"""
+        self.stats["invalidations"] += 1
+        if self._inflight:
+            # Les lectures en cours peuvent précéder l'écriture : seules celles de cette réunion sont refaites
+            self._clock += 1
+            self._invalidated[meeting_id] = self._clock
+        entry = self._entries.pop(f"id:{meeting_id}", None)
+        if entry:
+            for key in self._keys(entry[1]):
+                self._entries.pop(key, None)
+    
+    def set_revisions(self, meeting_id: str, revisions: Dict[str, int]):
+        """Reporter une nouvelle révision sur le document en cache, seul champ modifié"""
+        entry = self._entries.get(f"id:{meeting_id}")
+        if entry:
+            for field, value in revisions.items():
+                if value > entry[1].get(field, 0):
+                    entry[1][field] = value
+    
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        return {
+            "ttl_seconds": self.ttl,
+            "entries": len(self._entries),
+            **self.stats,
+            "hit_ratio": round((lookups - self.stats["misses"]) / lookups, 3) if lookups else 0.0
+        }
+
+meeting_cache = MeetingCache(ttl_seconds=float(os.environ.get('MEETING_CACHE_TTL_SECONDS', '5')))
+
+# Meeting revisions and conditional requests
+async def bump_meeting_revision(meeting_id: str, polls: bool = False) -> Optional[int]:
+    """Incrémenter la révision d'une réunion après un changement visible par les clients.
+    
+    `polls` incrémente aussi `poll_revision`, sur laquelle reposent la vue participant
+    des sondages et son ETag : les arrivées et validations de participants ne l'invalident pas.
+    """
+    increments = {"revision": 1, "poll_revision": 1} if polls else {"revision": 1}
+    meeting = await db.meetings.find_one_and_update(
+        {"id": meeting_id},
+        {"$inc": increments},
+        projection={"revision": 1, "poll_revision": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    if not meeting:
+        return None
+    # Seules les révisions changent : le document en cache reste valable
+    meeting_cache.set_revisions(meeting_id, {field: meeting[field] for field in increments})
+    return meeting["revision"]
+
+# Les participants et sondages portent la révision de réunion de leur dernière
+# modification. Une écriture les marque d'abord PENDING_REVISION (toujours renvoyés
+# par /changes), puis `commit_meeting_change` réserve la révision et la leur attribue :
+# un client ne peut donc jamais obtenir une révision sans les changements qu'elle couvre.
+PENDING_REVISION = 2 ** 62
+
+async def commit_meeting_change(meeting_id: str, collection=None, entity_id: Optional[str] = None) -> Optional[int]:
+    """Publier un changement : nouvelle révision de réunion, puis marquage de l'entité modifiée"""
+    polls = collection is not None and collection.name == "polls"
+    revision = await bump_meeting_revision(meeting_id, polls=polls)
+    if revision is not None and collection is not None:
+        await collection.update_one(
+            {"id": entity_id, "revision": PENDING_REVISION},
+            {"$set": {"revision": revision}}
+        )
+    return revision
+
+def make_etag(meeting_id: str, revision: int, view: str) -> str:
+    return f'"{view}-{meeting_id}-{revision}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Comparer l'ETag aux valeurs de If-None-Match (comparaison faible, cf. RFC 9110)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
 # Meeting endpoints
 @api_router.post("/meetings", response_model=Meeting)
 async def create_meeting(meeting_data: MeetingCreate):
@@ -261,7 +1145,7 @@ async def create_meeting(meeting_data: MeetingCreate):
 @api_router.post("/meetings/{meeting_id}/generate-recovery")
 async def generate_recovery_url(meeting_id: str):
     """Générer une URL de récupération avec mot de passe pour l'organisateur"""
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -281,8 +1165,9 @@ async def generate_recovery_url(meeting_id: str):
         {"$set": {
             "recovery_url": recovery_url,
             "recovery_password": recovery_password
-        }}
+        }, "$inc": {"revision": 1}}
     )
+    meeting_cache.invalidate(meeting_id)
     
     # Stocker les informations de récupération
     await db.recovery_sessions.insert_one({
@@ -319,7 +1204,7 @@ async def recover_meeting_access(recovery_data: RecoveryRequest):
         raise HTTPException(status_code=403, detail="Mot de passe incorrect")
     
     # Récupérer la réunion
-    meeting = await db.meetings.find_one({"id": recovery_session["meeting_id"]})
+    meeting = await meeting_cache.get(recovery_session["meeting_id"])
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -330,8 +1215,9 @@ async def recover_meeting_access(recovery_data: RecoveryRequest):
             "organizer_present": True,
             "organizer_last_seen": datetime.utcnow(),
             "leadership_transferred_to": None
-        }}
+        }, "$inc": {"revision": 1}}
     )
+    meeting_cache.invalidate(recovery_session["meeting_id"])
     
     return {
         "meeting": Meeting(**meeting),
@@ -341,7 +1227,7 @@ async def recover_meeting_access(recovery_data: RecoveryRequest):
 @api_router.post("/meetings/{meeting_id}/heartbeat")
 async def organizer_heartbeat(meeting_id: str, heartbeat_data: OrganizerHeartbeat):
     """Signal de vie de l'organisateur"""
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -350,22 +1236,24 @@ async def organizer_heartbeat(meeting_id: str, heartbeat_data: OrganizerHeartbea
         meeting.get("leadership_transferred_to") != heartbeat_data.organizer_name):
         raise HTTPException(status_code=403, detail="Non autorisé")
     
-    # Mettre à jour la présence
+    # Mettre à jour la présence (la révision ne change que si l'état de présence change)
+    presence_changed = not meeting.get("organizer_present", True) or meeting.get("auto_deletion_scheduled") is not None
     await db.meetings.update_one(
         {"id": meeting_id},
         {"$set": {
             "organizer_present": True,
             "organizer_last_seen": datetime.utcnow(),
             "auto_deletion_scheduled": None  # Annuler la suppression automatique
-        }}
+        }, "$inc": {"revision": 1 if presence_changed else 0}}
     )
+    meeting_cache.invalidate(meeting_id)
     
     return {"status": "heartbeat_received"}
 
 @api_router.get("/meetings/{meeting_id}/can-close")
 async def can_close_meeting(meeting_id: str):
     """Vérifier si la réunion peut être fermée (rapport téléchargé)"""
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -377,7 +1265,7 @@ async def can_close_meeting(meeting_id: str):
 @api_router.get("/meetings/{meeting_id}/partial-report")
 async def generate_partial_report(meeting_id: str):
     """Générer un rapport partiel quand l'organisateur est absent"""
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -385,51 +1273,123 @@ async def generate_partial_report(meeting_id: str):
     if meeting.get("organizer_present", True):
         raise HTTPException(status_code=400, detail="Rapport partiel disponible seulement quand l'organisateur est absent")
     
-    # Générer le rapport partiel (sans supprimer les données)
-    participants = await db.participants.find({"meeting_id": meeting_id}).to_list(1000)
-    scrutators = await db.scrutators.find({"meeting_id": meeting_id}).to_list(1000)
-    polls = await db.polls.find({"meeting_id": meeting_id}).to_list(1000)
-    
-    # Mettre à jour les résultats des sondages
-    for poll in polls:
-        await update_poll_results(poll["id"])
-    
-    updated_polls = await db.polls.find({"meeting_id": meeting_id}).to_list(1000)
-    
+    # Un rendu par révision de réunion, partagé par toutes les demandes simultanées
+    current = await db.meetings.find_one({"id": meeting_id}, {"revision": 1})
+    revision = current.get("revision", 0) if current else meeting.get("revision", 0)
     try:
-        # Générer le PDF avec mention "RAPPORT PARTIEL"
-        meeting_data = meeting.copy()
-        meeting_data["title"] = f"[RAPPORT PARTIEL] {meeting_data['title']}"
-        
-        pdf_path = generate_pdf_report(meeting_data, participants, updated_polls, scrutators)
-        
-        safe_title = "".join(c for c in meeting['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        filename = f"Rapport_Partiel_{safe_title}_{meeting['meeting_code']}.pdf"
-        
-        return FileResponse(
-            path=pdf_path,
-            filename=filename,
-            media_type='application/pdf',
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        filename, pdf_bytes = await partial_reports.get(
+            meeting_id, revision, lambda: render_partial_report(meeting)
         )
+        return pdf_response(pdf_bytes, filename)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating partial report for meeting {meeting_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Erreur lors de la génération du rapport partiel: {str(e)}")
 
+async def render_partial_report(meeting: dict) -> tuple:
+    """Générer le rapport partiel (sans supprimer les données) : (nom de fichier, PDF)"""
+    meeting_id = meeting["id"]
+    participants, scrutators, updated_polls = await load_report_data(meeting_id)
+    
+    # Générer le PDF avec mention "RAPPORT PARTIEL"
+    meeting_data = meeting.copy()
+    meeting_data["title"] = f"[RAPPORT PARTIEL] {meeting_data['title']}"
+    
+    pdf_bytes = await report_renderer.render(meeting_data, participants, updated_polls, scrutators)
+    
+    safe_title = "".join(c for c in meeting['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    filename = f"Rapport_Partiel_{safe_title}_{meeting['meeting_code']}.pdf"
+    return filename, pdf_bytes
+
+# Partial report cache
+class PartialReportCache:
+    """Rapports partiels déjà rendus, par (réunion, révision).
+    
+    Quand l'organisateur s'absente, tous les participants sont invités à télécharger
+    le même rapport : les demandes simultanées pour une révision partagent un seul
+    rendu, et les suivantes reçoivent le PDF en mémoire. Seule la dernière révision
+    d'une réunion est conservée ; au-delà de `max_bytes`, les rapports les moins
+    récemment servis sont évincés.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._reports: "OrderedDict[tuple, tuple]" = OrderedDict()  # (meeting_id, révision) -> (nom, PDF)
+        self._size = 0
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.stats = {"hits": 0, "renders": 0, "coalesced": 0, "evictions": 0}
+    
+    async def get(self, meeting_id: str, revision: int, render) -> tuple:
+        key = (meeting_id, revision)
+        report = self._reports.get(key)
+        if report is not None:
+            self.stats["hits"] += 1
+            self._reports.move_to_end(key)
+            return report
+        
+        future = self._inflight.get(key)
+        if future is None:
+            self.stats["renders"] += 1
+            future = asyncio.ensure_future(self._render(key, render))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(future)
+    
+    async def _render(self, key: tuple, render) -> tuple:
+        report = await render()
+        meeting_id, revision = key
+        if any(other[0] == meeting_id and other[1] > revision for other in self._reports):
+            return report  # rendu dépassé par une révision plus récente
+        self.forget(meeting_id)  # les révisions précédentes ne seront plus demandées
+        if len(report[1]) <= self.max_bytes:
+            self._reports[key] = report
+            self._size += len(report[1])
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._reports.popitem(last=False)
+                self._size -= len(evicted)
+                self.stats["evictions"] += 1
+        return report
+    
+    def forget(self, meeting_id: str):
+        for key in [key for key in self._reports if key[0] == meeting_id]:
+            self._size -= len(self._reports.pop(key)[1])
+    
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "reports": len(self._reports),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            **self.stats
+        }
+
+partial_reports = PartialReportCache(
+    max_bytes=int(float(os.environ.get('PARTIAL_REPORT_CACHE_MAX_MB', '64')) * 1024 * 1024)
+)
+
 @api_router.get("/meetings/{meeting_code}")
 async def get_meeting_by_code(meeting_code: str):
-    meeting = await db.meetings.find_one({"meeting_code": meeting_code, "status": "active"})
+    meeting = await meeting_cache.get_active_by_code(meeting_code)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     return Meeting(**meeting)
 
 @api_router.get("/meetings/{meeting_id}/organizer")
-async def get_meeting_organizer_view(meeting_id: str):
+async def get_meeting_organizer_view(meeting_id: str, request: Request, response: Response):
     meeting = await db.meetings.find_one({"id": meeting_id})
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
+    # Rien n'a changé depuis la dernière réponse : pas de lecture des participants ni des sondages
+    etag = make_etag(meeting_id, meeting.get("revision", 0), "organizer")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    
     # Get participants
     participants = await db.participants.find({"meeting_id": meeting_id}).to_list(1000)
     
@@ -442,6 +1402,36 @@ async def get_meeting_organizer_view(meeting_id: str):
         "polls": [Poll(**poll) for poll in polls]
     }
 
+@api_router.get("/meetings/{meeting_id}/changes")
+async def get_meeting_changes(meeting_id: str, since: int = 0):
+    """Participants et sondages modifiés après la révision `since` (0 = état complet)"""
+    meeting = await db.meetings.find_one({"id": meeting_id})
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    revision = meeting.get("revision", 0)
+    if since > revision:
+        since = 0  # Révision inconnue du serveur : renvoyer l'état complet
+    if since and since == revision:
+        return {"revision": revision, "changed": False}
+    
+    changed_filter = {"meeting_id": meeting_id}
+    if since:
+        changed_filter["revision"] = {"$gt": since}
+    participants, polls = await asyncio.gather(
+        db.participants.find(changed_filter).to_list(None),
+        db.polls.find(changed_filter).to_list(None)
+    )
+    
+    return {
+        "revision": revision,
+        "changed": True,
+        "full": not since,
+        "meeting": Meeting(**meeting),
+        "participants": [Participant(**p) for p in participants],
+        "polls": [Poll(**poll) for poll in polls]
+    }
+
 # Participant endpoints
 @api_router.post("/participants/join")
 async def join_meeting(join_data: ParticipantJoin):
@@ -461,7 +1451,7 @@ async def join_meeting(join_data: ParticipantJoin):
     clean_code = join_data.meeting_code.strip().upper()
     
     # Check if meeting exists and is active
-    meeting = await db.meetings.find_one({"meeting_code": clean_code, "status": "active"})
+    meeting = await meeting_cache.get_active_by_code(clean_code)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée ou inactive")
     
@@ -474,7 +1464,8 @@ async def join_meeting(join_data: ParticipantJoin):
         raise HTTPException(status_code=400, detail="Ce nom est déjà pris dans cette réunion")
     
     participant = Participant(name=clean_name, meeting_id=meeting["id"])
-    await db.participants.insert_one(participant.dict())
+    await db.participants.insert_one({**participant.dict(), "revision": PENDING_REVISION})
+    await commit_meeting_change(meeting["id"], db.participants, participant.id)
     
     # Notify organizer via WebSocket
     await manager.send_to_meeting({
@@ -506,7 +1497,7 @@ async def add_scrutators(meeting_id: str, scrutator_data: ScrutatorAdd):
         raise HTTPException(status_code=400, detail="Les noms de scrutateurs doivent être uniques")
     
     # Vérifier que la réunion existe
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -519,8 +1510,9 @@ async def add_scrutators(meeting_id: str, scrutator_data: ScrutatorAdd):
         {"$set": {
             "scrutators": clean_names,
             "scrutator_code": scrutator_code
-        }}
+        }, "$inc": {"revision": 1}}
     )
+    meeting_cache.invalidate(meeting_id)
     
     # Ajouter les scrutateurs dans la collection scrutators pour traçabilité
     scrutator_docs = []
@@ -540,7 +1532,7 @@ async def add_scrutators(meeting_id: str, scrutator_data: ScrutatorAdd):
 @api_router.get("/meetings/{meeting_id}/scrutators")
 async def get_meeting_scrutators(meeting_id: str):
     """Obtenir la liste des scrutateurs d'une réunion"""
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -584,7 +1576,7 @@ async def request_report_generation(meeting_id: str, request_data: ReportGenerat
     """Génération directe du rapport - plus d'approbation des scrutateurs nécessaire"""
     
     # Vérifier que la réunion existe
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -596,7 +1588,7 @@ async def submit_scrutator_vote(meeting_id: str, vote_data: ScrutatorReportVote)
     """Voter pour la génération du rapport en tant que scrutateur"""
     
     # Vérifier que la réunion existe et qu'une demande est en cours
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -618,8 +1610,9 @@ async def submit_scrutator_vote(meeting_id: str, vote_data: ScrutatorReportVote)
     
     await db.meetings.update_one(
         {"id": meeting_id},
-        {"$set": {"report_votes": current_votes}}
+        {"$set": {"report_votes": current_votes}, "$inc": {"revision": 1}}
     )
+    meeting_cache.invalidate(meeting_id)
     
     # Vérifier si tous les scrutateurs ont voté ou si la majorité est atteinte
     approved_scrutators = await db.scrutators.find({
@@ -653,8 +1646,9 @@ async def submit_scrutator_vote(meeting_id: str, vote_data: ScrutatorReportVote)
             {"$set": {
                 "report_generation_pending": False,
                 "report_generation_approved": True
-            }}
+            }, "$inc": {"revision": 1}}
         )
+        meeting_cache.invalidate(meeting_id)
         
         await manager.send_to_meeting({
             "type": "report_generation_approved",
@@ -676,8 +1670,9 @@ async def submit_scrutator_vote(meeting_id: str, vote_data: ScrutatorReportVote)
             {"$set": {
                 "report_generation_pending": False,
                 "report_generation_approved": False
-            }}
+            }, "$inc": {"revision": 1}}
         )
+        meeting_cache.invalidate(meeting_id)
         
         await manager.send_to_meeting({
             "type": "report_generation_rejected",
@@ -718,7 +1713,7 @@ async def join_as_scrutator(join_data: ScrutatorJoin):
     clean_code = join_data.scrutator_code.strip().upper()
     
     # Vérifier que le code de scrutateur existe
-    meeting = await db.meetings.find_one({"scrutator_code": clean_code, "status": "active"})
+    meeting = await meeting_cache.get_active_by_scrutator_code(clean_code)
     if not meeting:
         raise HTTPException(status_code=404, detail="Code de scrutateur invalide ou réunion inactive")
     
@@ -780,8 +1775,9 @@ async def approve_participant(participant_id: str, approval: ParticipantApproval
     new_status = ParticipantStatus.APPROVED if approval.approved else ParticipantStatus.REJECTED
     await db.participants.update_one(
         {"id": participant_id},
-        {"$set": {"approval_status": new_status}}
+        {"$set": {"approval_status": new_status, "revision": PENDING_REVISION}}
     )
+    await commit_meeting_change(participant["meeting_id"], db.participants, participant_id)
     
     # Notify via WebSocket
     await manager.send_to_meeting({
@@ -826,7 +1822,7 @@ async def create_poll(meeting_id: str, poll_data: PollCreate):
         raise HTTPException(status_code=400, detail="Les options doivent être uniques")
     
     # Verify meeting exists
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Réunion non trouvée")
     
@@ -838,7 +1834,8 @@ async def create_poll(meeting_id: str, poll_data: PollCreate):
         timer_duration=poll_data.timer_duration
     )
     
-    await db.polls.insert_one(poll.dict())
+    await db.polls.insert_one({**poll.dict(), "revision": PENDING_REVISION})
+    await commit_meeting_change(meeting_id, db.polls, poll.id)
     return poll
 
 @api_router.post("/polls/{poll_id}/start")
@@ -849,10 +1846,12 @@ async def start_poll(poll_id: str):
     
     update_data = {
         "status": PollStatus.ACTIVE,
-        "timer_started_at": datetime.utcnow() if poll.get("timer_duration") else None
+        "timer_started_at": datetime.utcnow() if poll.get("timer_duration") else None,
+        "revision": PENDING_REVISION
     }
     
     await db.polls.update_one({"id": poll_id}, {"$set": update_data})
+    await commit_meeting_change(poll["meeting_id"], db.polls, poll_id)
     
     # Notify participants
     await manager.send_to_meeting({
@@ -868,7 +1867,15 @@ async def close_poll(poll_id: str):
     if not poll:
         raise HTTPException(status_code=404, detail="Poll not found")
     
-    await db.polls.update_one({"id": poll_id}, {"$set": {"status": PollStatus.CLOSED}})
+    # Les bulletins groupés en attente sont écrits avant la clôture, les suivants refusés
+    await vote_ingestion.flush_then(lambda: db.polls.update_one(
+        {"id": poll_id},
+        {"$set": {"status": PollStatus.CLOSED, "revision": PENDING_REVISION}}
+    ))
+    await commit_meeting_change(poll["meeting_id"], db.polls, poll_id)
+    
+    # Envoyer le décompte final avant l'annonce de clôture
+    await vote_broadcasts.flush(poll_id, poll["meeting_id"])
     
     # Notify participants
     await manager.send_to_meeting({
@@ -884,99 +1891,577 @@ async def get_meeting_polls(meeting_id: str):
     return [Poll(**poll) for poll in polls]
 
 @api_router.get("/meetings/{meeting_id}/polls/participant")
-async def get_meeting_polls_for_participant(meeting_id: str):
+async def get_meeting_polls_for_participant(meeting_id: str, request: Request):
     """Get polls for participants - hide detailed results for active polls"""
+    meeting = await db.meetings.find_one({"id": meeting_id}, {"poll_revision": 1})
+    if not meeting:
+        return await build_participant_polls(meeting_id)
+    
+    revision = meeting.get("poll_revision", 0)
+    etag = make_etag(meeting_id, revision, "participant-polls")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(
+        content=await participant_polls_view.get(meeting_id, revision),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+async def build_participant_polls(meeting_id: str) -> List[dict]:
+    """Vue participant des sondages : détails masqués tant qu'un sondage n'est pas fermé"""
     polls = await db.polls.find({"meeting_id": meeting_id}).to_list(1000)
     
     participant_polls = []
     for poll_data in polls:
-        poll = Poll(**poll_data)
+        poll = Poll(**poll_data).dict()
+        poll["total_votes_count"] = sum(option["votes"] for option in poll["options"])
+        
+        # Si le sondage n'est pas fermé, seul le total est visible
+        if poll["status"] != PollStatus.CLOSED:
+            for option in poll["options"]:
+                option["votes"] = 0
+        
+        participant_polls.append(poll)
+    
+    return participant_polls
+
+# Materialized participant poll view
+class ParticipantPollsView:
+    """Vue participant des sondages, encodée une seule fois par révision des sondages.
+    
+    La vue est identique pour tous les participants d'une réunion. Elle est
+    reconstruite au premier appel qui suit un changement de `poll_revision` (création,
+    démarrage ou clôture d'un sondage, diffusion des votes, réparation d'un décompte)
+    et servie ensuite telle quelle, en octets JSON. Les appels simultanés sur une nouvelle révision partagent la construction.
+    """
+    
+    def __init__(self):
+        self._views: Dict[str, tuple] = {}  # meeting_id -> (révision des sondages, octets JSON)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.stats = {"hits": 0, "builds": 0}
+    
+    async def get(self, meeting_id: str, revision: int) -> bytes:
+        """Vue encodée pour `revision`, lue après la révision pour ne jamais être plus ancienne"""
+        view = self._views.get(meeting_id)
+        if view and view[0] == revision:
+            self.stats["hits"] += 1
+            return view[1]
         
-        # Si le sondage n'est pas fermé, masquer les résultats détaillés
-        if poll.status != PollStatus.CLOSED:
-            # Calculer seulement le nombre total de votes
-            total_votes = sum(opt.votes for opt in poll.options)
+        key = (meeting_id, revision)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._build(meeting_id, revision))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+    
+    async def _build(self, meeting_id: str, revision: int) -> bytes:
+        self.stats["builds"] += 1
+        body = orjson.dumps(await build_participant_polls(meeting_id), default=_json_default)
+        current = self._views.get(meeting_id)
+        if current is None or current[0] < revision:
+            self._views[meeting_id] = (revision, body)
+        return body
+    
+    def forget(self, meeting_id: str):
+        self._views.pop(meeting_id, None)
+    
+    def metrics(self) -> Dict[str, Any]:
+        return {"meetings": len(self._views), **self.stats}
+
+participant_polls_view = ParticipantPollsView()
+
+LONG_POLL_MAX_TIMEOUT_SECONDS = 25  # Sous le proxy_read_timeout de nginx (30 s)
+
+@api_router.get("/participants/{participant_id}/updates")
+async def wait_participant_updates(participant_id: str, since: Optional[int] = None, status: Optional[str] = None, timeout: float = 20):
+    """Long-poll participant : répond dès que son statut ou les sondages changent, ou à l'expiration.
+    
+    `since` est la révision des sondages (`poll_revision`) et `status` le statut
+    d'approbation déjà connus du client. Sans `since`, ou si l'un des deux a déjà
+    changé, la réponse est immédiate.
+    Une attente en cours n'est libérée par une diffusion de votes qu'après
+    `LONG_POLL_TALLY_HOLD_SECONDS`.
+    """
+    participant = await db.participants.find_one({"id": participant_id}, {"meeting_id": 1})
+    if not participant:
+        raise HTTPException(status_code=404, detail="Participant not found")
+    meeting_id = participant["meeting_id"]
+    
+    deadline = time.monotonic() + min(max(timeout, 0), LONG_POLL_MAX_TIMEOUT_SECONDS)
+    # S'abonner avant de lire la révision pour ne manquer aucune notification
+    with manager.watch(meeting_id, participant_id) as changed:
+        while True:
+            meeting = await db.meetings.find_one({"id": meeting_id}, {"poll_revision": 1})
+            if not meeting:
+                raise HTTPException(status_code=404, detail="Réunion non trouvée")
+            revision = meeting.get("poll_revision", 0)
+            participant = await db.participants.find_one({"id": participant_id}, {"approval_status": 1})
+            if not participant:
+                raise HTTPException(status_code=404, detail="Participant not found")
+            approval_status = participant["approval_status"]
+            
+            if since is None or revision != since or (status is not None and approval_status != status):
+                # La vue des sondages est insérée telle quelle, déjà encodée
+                polls = await participant_polls_view.get(meeting_id, revision)
+                header = orjson.dumps({"changed": True, "revision": revision, "status": approval_status})
+                return Response(content=header[:-1] + b',"polls":' + polls + b'}', media_type="application/json")
             
-            # Masquer les détails des votes pour chaque option
-            masked_options = []
-            for option in poll.options:
-                masked_option = option.dict()
-                masked_option["votes"] = 0  # Masquer le nombre de votes par option
-                masked_options.append(PollOption(**masked_option))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {"changed": False, "revision": revision}
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+            changed.clear()
+
+# Write-behind vote ingestion (group commit)
+class PollNotActiveError(Exception):
+    """Bulletin en file pour un sondage fermé avant l'écriture de son lot"""
+
+class VoteIngestionBuffer:
+    """File d'attente en mémoire qui regroupe les bulletins acceptés.
+    
+    Les bulletins sont écrits toutes les `flush_interval_ms` millisecondes ou dès que
+    `max_batch` bulletins sont en attente : un `$inc` combiné par option, filtré sur
+    le statut actif, puis un seul `insert_many` des bulletins comptés. Chaque appelant
+    n'est acquitté qu'une fois son bulletin écrit en base. Un sondage fermé avant son
+    `$inc`, y compris par un autre worker, voit ses bulletins refusés ; sur ce worker la
+    clôture prend aussi le verrou des lots et écrit d'abord ceux en attente.
+    """
+    
+    def __init__(self, enabled: bool, flush_interval_ms: int, max_batch: int):
+        self.enabled = enabled
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self._pending: List[tuple] = []
+        self._queued = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.stats = {
+            "batches_flushed": 0,
+            "votes_flushed": 0,
+            "flush_errors": 0,
+            "last_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0
+        }
+    
+    async def submit(self, vote: Vote):
+        """Mettre un bulletin en file et attendre que son lot soit durable"""
+        if self._closing:
+            raise RuntimeError("Vote ingestion buffer is shutting down")
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((vote, future))
+        if len(self._pending) == 1:
+            self._queued.set()
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+        return await future
+    
+    async def _run(self):
+        while not self._closing:
+            # Au repos, attendre le premier bulletin sans réveil périodique
+            if not self._pending:
+                self._wakeup.clear()
+                await self._queued.wait()
+                self._queued.clear()
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+    
+    async def flush(self):
+        """Écrire tous les bulletins en attente en une seule validation groupée"""
+        async with self._lock:
+            await self._flush_pending()
+    
+    async def flush_then(self, action):
+        """Écrire les bulletins en attente puis exécuter `action` sans qu'aucun lot ne s'intercale"""
+        async with self._lock:
+            await self._flush_pending()
+            return await action()
+    
+    async def _flush_pending(self):
+        while self._pending:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            await self._flush_batch(batch)
+    
+    async def _flush_batch(self, batch: List[tuple]):
+        started = time.perf_counter()
+        
+        # Compteurs d'abord, comme en mode direct : un `$inc` combiné par option, filtré
+        # sur le statut actif. Un sondage fermé entre-temps, sur n'importe quel worker, ne
+        # compte rien et ses bulletins ne sont pas insérés.
+        increments: Dict[tuple, int] = {}
+        for vote, _ in batch:
+            key = (vote.poll_id, vote.option_id)
+            increments[key] = increments.get(key, 0) + 1
+        results = await asyncio.gather(
+            *(self._increment(poll_id, option_id, count) for (poll_id, option_id), count in increments.items()),
+            return_exceptions=True
+        )
+        counted = set()
+        for key, result in zip(increments, results):
+            if isinstance(result, Exception):
+                # Incrément peut-être appliqué : à vérifier par reconcile-tallies après clôture
+                self.stats["flush_errors"] += 1
+                logger.error(f"Error counting buffered votes for poll {key[0]}, tally may need repair: {str(result)}")
+                self._fail(batch, key, result)
+            elif not result.matched_count:
+                self._fail(batch, key, PollNotActiveError(key[0]))
+            else:
+                counted.add(key)
+        batch = [(vote, future) for vote, future in batch if (vote.poll_id, vote.option_id) in counted]
+        if not batch:
+            return
+        
+        stored = await self._insert(batch)
+        unwritten = [(vote, future) for vote, future in batch if stored is None or vote.id not in stored]
+        if unwritten:
+            self.stats["flush_errors"] += 1
+            error = RuntimeError(f"{len(unwritten)} buffered votes were not stored")
+            if stored is not None:
+                # Annuler l'incrément des bulletins absents, qui seront refusés (503)
+                await self._uncount(unwritten)
+            else:
+                logger.error(f"Could not tell which buffered votes were stored, tallies of {sorted({key[0] for key in counted})} may need repair")
+            for _, future in unwritten:
+                if not future.done():
+                    future.set_exception(error)
+        
+        # Un bulletin écrit est acquitté, même si d'autres du lot ont échoué
+        written = [(vote, future) for vote, future in batch if stored is not None and vote.id in stored]
+        for _, future in written:
+            if not future.done():
+                future.set_result(None)
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats["batches_flushed"] += 1
+        self.stats["votes_flushed"] += len(written)
+        self.stats["last_batch_size"] = len(written)
+        self.stats["last_flush_ms"] = round(elapsed_ms, 2)
+        self.stats["max_flush_ms"] = round(max(self.stats["max_flush_ms"], elapsed_ms), 2)
+        self.stats["total_flush_ms"] += elapsed_ms
+    
+    @staticmethod
+    async def _increment(poll_id: str, option_id: str, count: int, active_only: bool = True):
+        query = {"id": poll_id, "options.id": option_id}
+        if active_only:
+            query["status"] = PollStatus.ACTIVE
+        return await db.polls.update_one(query, {"$inc": {"options.$.votes": count}})
+    
+    async def _insert(self, batch: List[tuple]) -> Optional[set]:
+        """Ids des bulletins effectivement écrits, ou None si on ne peut pas le savoir"""
+        try:
+            await db.votes.insert_many([vote.dict() for vote, _ in batch], ordered=False)
+            return {vote.id for vote, _ in batch}
+        except Exception as e:
+            logger.error(f"Error storing {len(batch)} buffered votes: {str(e)}")
+        try:
+            # Insertion partielle possible : relire les bulletins présents
+            rows = await db.votes.find({"id": {"$in": [vote.id for vote, _ in batch]}}, {"id": 1}).to_list(None)
+            return {row["id"] for row in rows}
+        except Exception as e:
+            logger.error(f"Error checking stored buffered votes: {str(e)}")
+            return None
+    
+    async def _uncount(self, votes: List[tuple]):
+        decrements: Dict[tuple, int] = {}
+        for vote, _ in votes:
+            key = (vote.poll_id, vote.option_id)
+            decrements[key] = decrements.get(key, 0) - 1
+        for (poll_id, option_id), count in decrements.items():
+            try:
+                await self._increment(poll_id, option_id, count, active_only=False)
+            except Exception as e:
+                logger.error(f"Error reverting buffered votes for poll {poll_id}, tally may need repair: {str(e)}")
+    
+    @staticmethod
+    def _fail(batch: List[tuple], key: tuple, error: Exception):
+        for vote, future in batch:
+            if (vote.poll_id, vote.option_id) == key and not future.done():
+                future.set_exception(error)
+    
+    async def stop(self):
+        """Vider la file avant l'arrêt du serveur"""
+        self._closing = True
+        self._queued.set()
+        self._wakeup.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as e:
+                logger.error(f"Error stopping vote ingestion buffer: {str(e)}")
+        await self.flush()
+    
+    def metrics(self) -> Dict[str, Any]:
+        batches = self.stats["batches_flushed"]
+        return {
+            "mode": "buffered" if self.enabled else "direct",
+            "pending_votes": len(self._pending),
+            **{k: v for k, v in self.stats.items() if k != "total_flush_ms"},
+            "avg_flush_ms": round(self.stats["total_flush_ms"] / batches, 2) if batches else 0.0
+        }
+
+vote_ingestion = VoteIngestionBuffer(
+    enabled=os.environ.get('VOTE_INGESTION_MODE', 'direct') == 'buffered',
+    flush_interval_ms=int(os.environ.get('VOTE_FLUSH_INTERVAL_MS', '5')),
+    max_batch=int(os.environ.get('VOTE_FLUSH_MAX_BATCH', '500'))
+)
+
+# Coalesced tally broadcasts
+class VoteBroadcastCoalescer:
+    """Limiter les diffusions `vote_submitted` à `max_per_second` par sondage.
+    
+    Le premier vote est diffusé immédiatement ; les suivants sont regroupés et la
+    diffusion suivante relit le sondage pour porter les derniers comptes. Seules les
+    options dont le compte a changé depuis la diffusion précédente sont envoyées.
+    L'état n'existe que pendant qu'un sondage reçoit des votes.
+    """
+    
+    def __init__(self, max_per_second: float):
+        self.interval = 1 / max_per_second if max_per_second > 0 else 0
+        self._dirty: Dict[str, str] = {}  # poll_id -> meeting_id
+        self._active: Dict[str, asyncio.Task] = {}
+        self._last_counts: Dict[str, Dict[str, int]] = {}  # poll_id -> {option_id: votes}
+        self.stats = {"votes_received": 0, "broadcasts_sent": 0}
+    
+    def notify(self, poll_id: str, meeting_id: str):
+        """Signaler un nouveau vote ; la diffusion se fera au plus tard après un intervalle"""
+        self.stats["votes_received"] += 1
+        self._dirty[poll_id] = meeting_id
+        if poll_id not in self._active:
+            self._active[poll_id] = asyncio.create_task(self._run(poll_id))
+    
+    async def _run(self, poll_id: str):
+        try:
+            while poll_id in self._dirty:
+                await self._send(poll_id, self._dirty.pop(poll_id))
+                await asyncio.sleep(self.interval)
+        finally:
+            if self._active.get(poll_id) is asyncio.current_task():
+                del self._active[poll_id]
+                self._last_counts.pop(poll_id, None)
+    
+    async def _send(self, poll_id: str, meeting_id: str):
+        try:
+            poll = await db.polls.find_one({"id": poll_id}, {"options.id": 1, "options.votes": 1})
+            if not poll:
+                return
             
-            # Créer une version masquée du poll
-            masked_poll = poll.dict()
-            masked_poll["options"] = masked_options
-            masked_poll["total_votes_count"] = total_votes  # Ajouter le total seulement
+            counts = {option["id"]: option["votes"] for option in poll["options"]}
+            previous = self._last_counts.get(poll_id, {})
+            changed = [
+                {"id": option_id, "votes": votes}
+                for option_id, votes in counts.items()
+                if previous.get(option_id) != votes
+            ]
+            if not changed:
+                return
             
-            participant_polls.append(masked_poll)
-        else:
-            # Sondage fermé - afficher tous les résultats
-            poll_dict = poll.dict()
-            poll_dict["total_votes_count"] = sum(opt.votes for opt in poll.options)
-            participant_polls.append(poll_dict)
+            self._last_counts[poll_id] = counts
+            self.stats["broadcasts_sent"] += 1
+            # Une révision par diffusion plutôt que par bulletin
+            await db.polls.update_one({"id": poll_id}, {"$set": {"revision": PENDING_REVISION}})
+            await commit_meeting_change(meeting_id, db.polls, poll_id)
+            await manager.send_to_meeting({
+                "type": "vote_submitted",
+                "poll_id": poll_id,
+                "options": changed,
+                "total_votes": sum(counts.values())
+            }, meeting_id)
+        except Exception as e:
+            logger.error(f"Error broadcasting tally for poll {poll_id}: {str(e)}")
+    
+    async def flush(self, poll_id: str, meeting_id: str):
+        """Diffuser immédiatement le décompte en attente d'un sondage (ex. avant sa clôture)"""
+        task = self._active.pop(poll_id, None)
+        pending = self._dirty.pop(poll_id, None)
+        if task is not None:
+            task.cancel()
+        if task is not None or pending is not None:
+            await self._send(poll_id, meeting_id)
+        self._last_counts.pop(poll_id, None)
+    
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "max_per_second": round(1 / self.interval, 2) if self.interval else None,
+            "active_polls": len(self._active),
+            **self.stats
+        }
+
+vote_broadcasts = VoteBroadcastCoalescer(
+    max_per_second=float(os.environ.get('VOTE_BROADCAST_MAX_PER_SECOND', '2'))
+)
+
+async def get_votable_poll(vote_data: VoteCreate) -> dict:
+    """Vérifier que le sondage existe, qu'il est actif et que l'option est valide"""
+    poll = await db.polls.find_one({"id": vote_data.poll_id})
+    if not poll:
+        raise HTTPException(status_code=404, detail="Sondage non trouvé")
     
-    return participant_polls
+    if poll["status"] != PollStatus.ACTIVE:
+        raise HTTPException(status_code=400, detail="Le sondage n'est pas actif")
+    
+    # Check if option exists
+    option_exists = any(opt["id"] == vote_data.option_id for opt in poll["options"])
+    if not option_exists:
+        raise HTTPException(status_code=400, detail="Option invalide")
+    
+    return poll
 
 # Voting endpoints
 @api_router.post("/votes")
 async def submit_vote(vote_data: VoteCreate):
-    # Get or create lock for this poll
-    async with lock_manager:
-        if vote_data.poll_id not in vote_locks:
-            vote_locks[vote_data.poll_id] = asyncio.Lock()
-        poll_lock = vote_locks[vote_data.poll_id]
-    
-    # Use lock to prevent concurrent vote updates
-    async with poll_lock:
-        # Verify poll exists and is active
-        poll = await db.polls.find_one({"id": vote_data.poll_id})
-        if not poll:
-            raise HTTPException(status_code=404, detail="Sondage non trouvé")
-        
-        if poll["status"] != PollStatus.ACTIVE:
+    # Create anonymous vote
+    vote = Vote(poll_id=vote_data.poll_id, option_id=vote_data.option_id)
+    
+    if vote_ingestion.enabled:
+        # Mode groupé : validation en lecture puis écriture groupée des bulletins
+        poll = await get_votable_poll(vote_data)
+        try:
+            await vote_ingestion.submit(vote)
+        except PollNotActiveError:
             raise HTTPException(status_code=400, detail="Le sondage n'est pas actif")
+        except Exception:
+            raise HTTPException(status_code=503, detail="Le vote n'a pas pu être enregistré, veuillez réessayer")
+    else:
+        # Admission atomique : le compteur n'est incrémenté que si le sondage est actif
+        # et que l'option existe, vérifiés dans la même mise à jour filtrée
+        updated_poll = await apply_vote_to_tally(vote_data.poll_id, vote_data.option_id)
+        if not updated_poll:
+            # Relire le sondage uniquement pour renvoyer l'erreur précise
+            await get_votable_poll(vote_data)
+            raise HTTPException(status_code=409, detail="Le sondage a changé, veuillez réessayer")
+        poll = updated_poll
         
-        # Check if option exists
-        option_exists = any(opt["id"] == vote_data.option_id for opt in poll["options"])
-        if not option_exists:
-            raise HTTPException(status_code=400, detail="Option invalide")
-        
-        # Create anonymous vote
-        vote = Vote(poll_id=vote_data.poll_id, option_id=vote_data.option_id)
-        await db.votes.insert_one(vote.dict())
-        
-        # Update poll results immediately in the same transaction
-        await update_poll_results(vote_data.poll_id)
-        
-        # Notify real-time updates
-        updated_poll = await db.polls.find_one({"id": vote_data.poll_id})
-        await manager.send_to_meeting({
-            "type": "vote_submitted",
-            "poll": Poll(**updated_poll).dict()
-        }, poll["meeting_id"])
-        
-        return {"status": "vote_submitted", "message": "Vote enregistré avec succès"}
+        try:
+            await db.votes.insert_one(vote.dict())
+        except Exception as e:
+            # Annuler l'incrément pour garder compteurs et bulletins cohérents
+            await db.polls.update_one(
+                {"id": vote_data.poll_id, "options.id": vote_data.option_id},
+                {"$inc": {"options.$.votes": -1}}
+            )
+            logger.error(f"Error storing vote for poll {vote_data.poll_id}: {str(e)}")
+            raise HTTPException(status_code=503, detail="Le vote n'a pas pu être enregistré, veuillez réessayer")
+    
+    # Notify real-time updates (regroupées par sondage)
+    vote_broadcasts.notify(vote_data.poll_id, poll["meeting_id"])
+    
+    return {"status": "vote_submitted", "message": "Vote enregistré avec succès"}
+
+async def apply_vote_to_tally(poll_id: str, option_id: str, count: int = 1) -> Optional[dict]:
+    """Incrémenter atomiquement le compteur d'une option et retourner le sondage mis à jour.
+    
+    Un bulletin coûte un seul `$inc` sur `options.$.votes` au lieu d'un recomptage
+    de tous les votes du sondage. Retourne None si le sondage n'existe pas, n'est pas
+    actif ou ne contient pas l'option : aucun verrou en mémoire n'est nécessaire, même
+    avec plusieurs workers.
+    """
+    return await db.polls.find_one_and_update(
+        {"id": poll_id, "status": PollStatus.ACTIVE, "options.id": option_id},
+        {"$inc": {"options.$.votes": count}},
+        return_document=ReturnDocument.AFTER
+    )
 
-async def update_poll_results(poll_id: str):
-    # Get all votes for this poll
-    votes = await db.votes.find({"poll_id": poll_id}).to_list(1000)
-    vote_counts = {}
+async def count_votes_for_polls(poll_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """Compter les bulletins par sondage et par option via une agrégation `$group` côté serveur"""
+    if not poll_ids:
+        return {}
     
-    for vote in votes:
-        option_id = vote["option_id"]
-        vote_counts[option_id] = vote_counts.get(option_id, 0) + 1
+    pipeline = [
+        {"$match": {"poll_id": {"$in": poll_ids}}},
+        {"$group": {
+            "_id": {"poll_id": "$poll_id", "option_id": "$option_id"},
+            "count": {"$sum": 1}
+        }}
+    ]
     
-    # Update poll options with vote counts
-    poll = await db.polls.find_one({"id": poll_id})
-    if poll:
+    counts: Dict[str, Dict[str, int]] = {}
+    async for row in db.votes.aggregate(pipeline):
+        counts.setdefault(row["_id"]["poll_id"], {})[row["_id"]["option_id"]] = row["count"]
+    return counts
+
+async def reconcile_poll_tallies(polls: List[dict], repair: bool = True) -> List[dict]:
+    """Comparer les compteurs stockés aux bulletins réels et corriger les écarts.
+    
+    Les documents `polls` passés en argument sont mis à jour en place avec les
+    comptes exacts. Retourne la liste des écarts détectés (vide si tout concorde).
+    
+    Seuls les sondages non actifs sont réparés : sur un sondage actif, un bulletin peut
+    se trouver entre son `$inc` et son insertion (ou entre `insert_many` et `bulk_write`
+    en mode tampon), et un `$set` écraserait les `$inc` arrivés depuis le comptage.
+    """
+    counts = await count_votes_for_polls([poll["id"] for poll in polls])
+    discrepancies = []
+    
+    for poll in polls:
+        poll_counts = counts.get(poll["id"], {})
+        drifted = []
         for option in poll["options"]:
-            option["votes"] = vote_counts.get(option["id"], 0)
+            counted = poll_counts.get(option["id"], 0)
+            if option.get("votes", 0) != counted:
+                drifted.append({
+                    "option_id": option["id"],
+                    "stored": option.get("votes", 0),
+                    "counted": counted
+                })
+            option["votes"] = counted
         
-        await db.polls.update_one(
-            {"id": poll_id},
-            {"$set": {"options": poll["options"]}}
-        )
+        if not drifted:
+            continue
+        
+        discrepancy = {"poll_id": poll["id"], "options": drifted, "repaired": False}
+        discrepancies.append(discrepancy)
+        if repair and poll.get("status") != PollStatus.ACTIVE:
+            # Corriger uniquement les compteurs concernés, sans réécrire le tableau d'options
+            set_fields = {}
+            array_filters = []
+            for i, drift in enumerate(drifted):
+                set_fields[f"options.$[o{i}].votes"] = drift["counted"]
+                array_filters.append({f"o{i}.id": drift["option_id"]})
+            set_fields["revision"] = PENDING_REVISION
+            result = await db.polls.update_one(
+                {"id": poll["id"], "status": {"$ne": PollStatus.ACTIVE}},
+                {"$set": set_fields},
+                array_filters=array_filters
+            )
+            if result.modified_count:
+                discrepancy["repaired"] = True
+                await commit_meeting_change(poll["meeting_id"], db.polls, poll["id"])
+                logger.warning(f"Repaired vote counters for poll {poll['id']}: {drifted}")
+    
+    return discrepancies
+
+@api_router.post("/meetings/{meeting_id}/reconcile-tallies")
+async def reconcile_meeting_tallies(meeting_id: str, repair: bool = True):
+    """Vérifier les compteurs de votes des sondages d'une réunion et réparer ceux des sondages non actifs"""
+    meeting = await meeting_cache.get(meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Réunion non trouvée")
+    
+    polls = await db.polls.find({"meeting_id": meeting_id}).to_list(None)
+    discrepancies = await reconcile_poll_tallies(polls, repair=repair)
+    
+    return {
+        "meeting_id": meeting_id,
+        "polls_checked": len(polls),
+        "discrepancies": discrepancies,
+        "repaired": sum(1 for discrepancy in discrepancies if discrepancy["repaired"])
+    }
 
 @api_router.get("/polls/{poll_id}/results")
 async def get_poll_results(poll_id: str):
@@ -984,8 +2469,9 @@ async def get_poll_results(poll_id: str):
     if not poll:
         raise HTTPException(status_code=404, detail="Poll not found")
     
-    await update_poll_results(poll_id)
-    updated_poll = await db.polls.find_one({"id": poll_id})
+    # Comptes exacts recalculés depuis les bulletins, sans réécrire le sondage
+    await reconcile_poll_tallies([poll], repair=False)
+    updated_poll = poll
     
     total_votes = sum(opt["votes"] for opt in updated_poll["options"])
     
@@ -1004,40 +2490,127 @@ async def get_poll_results(poll_id: str):
         "total_votes": total_votes
     }
 
+# Report styles, built once per process rather than once per report
+REPORT_STYLES = getSampleStyleSheet()
+
+REPORT_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=REPORT_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1e40af'),
+    alignment=TA_CENTER,
+    spaceAfter=30
+)
+
+REPORT_SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=REPORT_STYLES['Heading2'],
+    fontSize=16,
+    textColor=colors.HexColor('#374151'),
+    spaceAfter=20
+)
+
+REPORT_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=REPORT_STYLES['Normal'],
+    fontSize=9,
+    textColor=colors.grey,
+    alignment=TA_CENTER
+)
+
+def _roster_table_style(header_color: str) -> TableStyle:
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
+SCRUTATORS_TABLE_STYLE = _roster_table_style('#fef3c7')
+PARTICIPANTS_TABLE_STYLE = _roster_table_style('#f3f4f6')
+
+# Suite d'un tableau découpé : mêmes cellules, sans ligne d'en-tête
+ROSTER_CONTINUATION_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+RESULTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -2), colors.white),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#e5e7eb')),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+ROSTER_COLUMN_WIDTHS = [0.5*inch, 3*inch, 1.5*inch]
+
+# Un long tableau est émis par blocs : ReportLab remesure tout le reste d'un tableau
+# à chaque saut de page, ce qui rend un tableau unique quadratique en nombre de lignes.
+REPORT_TABLE_CHUNK_ROWS = 100
+
+def roster_tables(header: List[str], rows, style: TableStyle) -> tuple:
+    """Convertir un flux de lignes en tableaux consécutifs de REPORT_TABLE_CHUNK_ROWS lignes.
+    
+    Le premier bloc porte l'en-tête (répété si le bloc passe à la page suivante),
+    les suivants prolongent la grille sans en-tête. Renvoie (tableaux, nombre de lignes).
+    """
+    tables = []
+    chunk = [header]
+    count = 0
+    for row in rows:
+        chunk.append(row)
+        count += 1
+        if len(chunk) >= REPORT_TABLE_CHUNK_ROWS:
+            tables.append(_roster_chunk(chunk, style, first=not tables))
+            chunk = []
+    if chunk and count:
+        tables.append(_roster_chunk(chunk, style, first=not tables))
+    return tables, count
+
+def _roster_chunk(rows: List[List[str]], style: TableStyle, first: bool) -> Table:
+    table = Table(rows, colWidths=ROSTER_COLUMN_WIDTHS, repeatRows=1 if first else 0)
+    table.setStyle(style if first else ROSTER_CONTINUATION_STYLE)
+    return table
+
+def _as_datetime(value) -> datetime:
+    # Handle both datetime objects and ISO strings
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
 def generate_pdf_report(meeting_data, participants_data, polls_data, scrutators_data=None):
-    """Generate PDF report for the meeting"""
+    """Generate PDF report for the meeting.
     
-    # Create temporary file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-    temp_path = temp_file.name
-    temp_file.close()
+    `participants_data` and `scrutators_data` may be any iterable (list or generator):
+    rows are consumed once, in order, and turned into page-sized tables as they come.
+    """
     
-    # Create PDF document
-    doc = SimpleDocTemplate(temp_path, pagesize=A4)
-    styles = getSampleStyleSheet()
+    # Create PDF document in memory (no temporary file left on disk)
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    styles = REPORT_STYLES
     story = []
     
-    # Title style
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1e40af'),
-        alignment=TA_CENTER,
-        spaceAfter=30
-    )
-    
-    # Subtitle style
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#374151'),
-        spaceAfter=20
-    )
-    
     # Add title
-    story.append(Paragraph("RAPPORT DE VOTE SECRET", title_style))
+    story.append(Paragraph("RAPPORT DE VOTE SECRET", REPORT_TITLE_STYLE))
     story.append(Spacer(1, 20))
     
     # Meeting info
@@ -1049,10 +2622,7 @@ def generate_pdf_report(meeting_data, participants_data, polls_data, scrutators_
     
     # Format creation date in organizer's timezone
     if meeting_data.get('created_at'):
-        if isinstance(meeting_data['created_at'], str):
-            created_at = datetime.fromisoformat(meeting_data['created_at'].replace('Z', '+00:00'))
-        else:
-            created_at = meeting_data['created_at']
+        created_at = _as_datetime(meeting_data['created_at'])
         formatted_created_at = format_datetime_in_organizer_timezone(created_at, organizer_timezone)
         story.append(Paragraph(f"<b>Date de création:</b> {formatted_created_at}", styles['Normal']))
     
@@ -1062,78 +2632,37 @@ def generate_pdf_report(meeting_data, participants_data, polls_data, scrutators_
     story.append(Spacer(1, 30))
     
     # Scrutators section (if any)
-    if scrutators_data and len(scrutators_data) > 0:
-        story.append(Paragraph("SCRUTATEURS", subtitle_style))
-        
-        # Create scrutators table
-        scrutators_table_data = [['#', 'Nom du scrutateur', 'Ajouté le']]
-        for i, scrutator in enumerate(scrutators_data, 1):
-            # Handle both datetime objects and ISO strings, convert to organizer timezone
-            if isinstance(scrutator['added_at'], str):
-                added_datetime = datetime.fromisoformat(scrutator['added_at'].replace('Z', '+00:00'))
-            else:
-                added_datetime = scrutator['added_at']
-            
-            added_time = format_datetime_in_organizer_timezone(added_datetime, organizer_timezone)
-            scrutators_table_data.append([str(i), scrutator['name'], added_time])
-        
-        scrutators_table = Table(scrutators_table_data, colWidths=[0.5*inch, 3*inch, 1.5*inch])
-        scrutators_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#fef3c7')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        story.append(scrutators_table)
-        story.append(Paragraph(f"<b>Total des scrutateurs:</b> {len(scrutators_data)}", styles['Normal']))
+    scrutator_rows = (
+        [str(i), scrutator['name'], format_datetime_in_organizer_timezone(_as_datetime(scrutator['added_at']), organizer_timezone)]
+        for i, scrutator in enumerate(scrutators_data or [], 1)
+    )
+    scrutator_tables, scrutator_count = roster_tables(['#', 'Nom du scrutateur', 'Ajouté le'], scrutator_rows, SCRUTATORS_TABLE_STYLE)
+    if scrutator_count:
+        story.append(Paragraph("SCRUTATEURS", REPORT_SUBTITLE_STYLE))
+        story.extend(scrutator_tables)
+        story.append(Paragraph(f"<b>Total des scrutateurs:</b> {scrutator_count}", styles['Normal']))
         story.append(Spacer(1, 30))
     
     # Participants section
-    story.append(Paragraph("PARTICIPANTS APPROUVÉS", subtitle_style))
+    story.append(Paragraph("PARTICIPANTS APPROUVÉS", REPORT_SUBTITLE_STYLE))
     
-    # Create participants table
-    approved_participants = [p for p in participants_data if p['approval_status'] == 'approved']
+    approved_participants = (p for p in participants_data if p['approval_status'] == 'approved')
+    participant_rows = (
+        [str(i), participant['name'], format_datetime_in_organizer_timezone(_as_datetime(participant['joined_at']), organizer_timezone, '%H:%M')]
+        for i, participant in enumerate(approved_participants, 1)
+    )
+    participant_tables, participant_count = roster_tables(['#', 'Nom', 'Heure de participation'], participant_rows, PARTICIPANTS_TABLE_STYLE)
     
-    if approved_participants:
-        participants_table_data = [['#', 'Nom', 'Heure de participation']]
-        for i, participant in enumerate(approved_participants, 1):
-            # Handle both datetime objects and ISO strings, convert to organizer timezone
-            if isinstance(participant['joined_at'], str):
-                joined_datetime = datetime.fromisoformat(participant['joined_at'].replace('Z', '+00:00'))
-            else:
-                joined_datetime = participant['joined_at']
-            
-            joined_time = format_datetime_in_organizer_timezone(joined_datetime, organizer_timezone, '%H:%M')
-            participants_table_data.append([str(i), participant['name'], joined_time])
-        
-        participants_table = Table(participants_table_data, colWidths=[0.5*inch, 3*inch, 1.5*inch])
-        participants_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        story.append(participants_table)
-        story.append(Paragraph(f"<b>Total des participants approuvés:</b> {len(approved_participants)}", styles['Normal']))
+    if participant_count:
+        story.extend(participant_tables)
+        story.append(Paragraph(f"<b>Total des participants approuvés:</b> {participant_count}", styles['Normal']))
     else:
         story.append(Paragraph("Aucun participant approuvé", styles['Normal']))
     
     story.append(Spacer(1, 30))
     
     # Polls section
-    story.append(Paragraph("RÉSULTATS DES SONDAGES", subtitle_style))
+    story.append(Paragraph("RÉSULTATS DES SONDAGES", REPORT_SUBTITLE_STYLE))
     
     if polls_data:
         for i, poll in enumerate(polls_data, 1):
@@ -1158,22 +2687,8 @@ def generate_pdf_report(meeting_data, participants_data, polls_data, scrutators_
                 # Add total row
                 results_data.append(['TOTAL', str(total_votes), '100.0%'])
                 
-                results_table = Table(results_data, colWidths=[3*inch, 1*inch, 1*inch])
-                results_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 11),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -2), colors.white),
-                    ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#e5e7eb')),
-                    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTSIZE', (0, 1), (-1, -1), 10),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
+                results_table = Table(results_data, colWidths=[3*inch, 1*inch, 1*inch], repeatRows=1)
+                results_table.setStyle(RESULTS_TABLE_STYLE)
                 story.append(results_table)
             else:
                 story.append(Paragraph("Aucun vote enregistré pour ce sondage", styles['Normal']))
@@ -1184,50 +2699,184 @@ def generate_pdf_report(meeting_data, participants_data, polls_data, scrutators_
     
     # Footer
     story.append(Spacer(1, 50))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.grey,
-        alignment=TA_CENTER
-    )
-    story.append(Paragraph("Rapport généré par le système Vote Secret", footer_style))
-    story.append(Paragraph("Toutes les données de cette réunion ont été supprimées après génération de ce rapport", footer_style))
+    story.append(Paragraph("Rapport généré par le système Vote Secret", REPORT_FOOTER_STYLE))
+    story.append(Paragraph("Toutes les données de cette réunion ont été supprimées après génération de ce rapport", REPORT_FOOTER_STYLE))
     
     # Build PDF
     doc.build(story)
     
-    return temp_path
+    return buffer.getvalue()
+
+# Seuls les champs imprimés traversent la frontière du processus de rendu
+REPORT_PARTICIPANT_FIELDS = {"_id": 0, "name": 1, "joined_at": 1, "approval_status": 1}
+REPORT_SCRUTATOR_FIELDS = {"_id": 0, "name": 1, "added_at": 1}
+
+async def load_report_participants(meeting_id: str) -> List[dict]:
+    """Participants approuvés, lus par lots depuis le curseur sous forme de lignes compactes"""
+    cursor = db.participants.find(
+        {"meeting_id": meeting_id, "approval_status": "approved"},
+        REPORT_PARTICIPANT_FIELDS,
+        batch_size=1000
+    )
+    return [participant async for participant in cursor]
+
+async def load_report_polls(meeting_id: str) -> List[dict]:
+    """Sondages de la réunion avec les comptes exacts, recalculés depuis les bulletins.
+    
+    Une seule agrégation : chaque sondage rejoint ses bulletins (`$lookup` sur l'index
+    votes.poll_id) groupés par option. Les compteurs stockés ne sont pas réécrits.
+    """
+    if ENTITY_ID_STORAGE == "primary_key":
+        # `_id` binaire ne peut pas être joint au `poll_id` texte des bulletins
+        polls = await db.polls.find({"meeting_id": meeting_id}).to_list(None)
+        await reconcile_poll_tallies(polls, repair=False)
+        return polls
+    
+    pipeline = [
+        {"$match": {"meeting_id": meeting_id}},
+        {"$lookup": {
+            "from": "votes",
+            "localField": "id",
+            "foreignField": "poll_id",
+            "pipeline": [{"$group": {"_id": "$option_id", "count": {"$sum": 1}}}],
+            "as": "tallies"
+        }}
+    ]
+    polls = []
+    async for poll in db.polls.aggregate(pipeline):
+        counts = {tally["_id"]: tally["count"] for tally in poll.pop("tallies")}
+        for option in poll["options"]:
+            option["votes"] = counts.get(option["id"], 0)
+        polls.append(poll)
+    return polls
+
+async def load_report_data(meeting_id: str) -> tuple:
+    """Toutes les données du rapport en requêtes parallèles : (participants, scrutateurs, sondages)"""
+    participants, scrutators, polls = await asyncio.gather(
+        load_report_participants(meeting_id),
+        db.scrutators.find({"meeting_id": meeting_id}, REPORT_SCRUTATOR_FIELDS).to_list(None),
+        load_report_polls(meeting_id)
+    )
+    return participants, scrutators, polls
+
+# Report rendering in worker processes
+class ReportRenderer:
+    """Exécuter `generate_pdf_report` dans un pool de processus borné.
+    
+    Le rendu ReportLab est purement CPU : hors du processus principal, il ne bloque
+    plus la boucle d'événements (votes, heartbeats, WebSockets des autres réunions).
+    Au plus `max_workers` rendus s'exécutent à la fois ; une demande qui n'obtient pas
+    de place ou dont le rendu dépasse `timeout` secondes reçoit une erreur. Un rendu
+    abandonné garde sa place jusqu'à sa fin réelle, la limite reste donc exacte.
+    """
+    
+    def __init__(self, max_workers: int, timeout: float):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_workers)
+        self._running = 0
+        self.stats = {"rendered": 0, "failed": 0, "timeouts": 0, "rejected": 0}
+    
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # "spawn" : pas de fork d'un processus qui a des threads (client MongoDB)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
+    def _release(self, _):
+        self._running -= 1
+        self._slots.release()
+    
+    async def render(self, *args):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.stats["rejected"] += 1
+            raise HTTPException(status_code=503, detail="Trop de rapports en cours de génération, veuillez réessayer")
+        
+        try:
+            future = loop.run_in_executor(self._pool(), generate_pdf_report, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._running += 1
+        future.add_done_callback(self._release)
+        
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise HTTPException(status_code=504, detail="La génération du rapport a dépassé le délai autorisé")
+        except BrokenProcessPool:
+            # Un processus du pool s'est arrêté brutalement : repartir d'un pool neuf
+            self.stats["failed"] += 1
+            self._executor = None
+            raise
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        
+        self.stats["rendered"] += 1
+        return result
+    
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_workers,
+            "timeout_seconds": self.timeout,
+            "running": self._running,
+            **self.stats
+        }
+
+report_renderer = ReportRenderer(
+    max_workers=int(os.environ.get('REPORT_MAX_CONCURRENCY', '2')),
+    timeout=float(os.environ.get('REPORT_TIMEOUT_SECONDS', '120'))
+)
+
+PDF_CHUNK_SIZE = 64 * 1024
+
+def pdf_response(pdf: bytes, filename: str) -> StreamingResponse:
+    """Envoyer un PDF rendu en mémoire par blocs de PDF_CHUNK_SIZE octets"""
+    async def chunks():
+        view = memoryview(pdf)
+        for start in range(0, len(view), PDF_CHUNK_SIZE):
+            yield bytes(view[start:start + PDF_CHUNK_SIZE])
+    
+    return StreamingResponse(
+        chunks(),
+        media_type='application/pdf',
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(len(pdf))
+        }
+    )
 
 @api_router.get("/meetings/{meeting_id}/report")
 async def generate_meeting_report(meeting_id: str):
     """Generate and download PDF report - GÉNÉRATION DIRECTE sans approbation scrutateurs"""
     
     # Get meeting data
-    meeting = await db.meetings.find_one({"id": meeting_id})
+    meeting = await meeting_cache.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     # GÉNÉRATION DIRECTE - Plus de vérification d'approbation des scrutateurs
     # Get participants data
-    participants = await db.participants.find({"meeting_id": meeting_id}).to_list(1000)
-    
-    # Get scrutators data
-    scrutators = await db.scrutators.find({"meeting_id": meeting_id}).to_list(1000)
-    
-    # Get polls data with updated results
-    polls = await db.polls.find({"meeting_id": meeting_id}).to_list(1000)
-    
-    # Update all poll results before generating report
-    for poll in polls:
-        await update_poll_results(poll["id"])
-    
-    # Get updated polls with final results
-    updated_polls = await db.polls.find({"meeting_id": meeting_id}).to_list(1000)
+    # Get participants, scrutators and polls with final tallies, in parallel
+    participants, scrutators, updated_polls = await load_report_data(meeting_id)
     
     try:
         # Generate PDF with scrutators data
-        pdf_path = generate_pdf_report(meeting, participants, updated_polls, scrutators)
+        pdf_bytes = await report_renderer.render(meeting, participants, updated_polls, scrutators)
         
         # Create filename
         safe_title = "".join(c for c in meeting['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
@@ -1242,6 +2891,7 @@ async def generate_meeting_report(meeting_id: str):
                 "report_downloaded": True  # Marquer le rapport comme téléchargé
             }}
         )
+        meeting_cache.invalidate(meeting_id)
         
         # Delete all associated data after PDF generation
         # Delete votes first (they reference polls)
@@ -1283,18 +2933,19 @@ async def generate_meeting_report(meeting_id: str):
         
         # Finally delete the meeting itself
         delete_meeting_result = await db.meetings.delete_one({"id": meeting_id})
+        meeting_cache.invalidate(meeting_id)
+        await meeting_events.forget(meeting_id)
+        participant_polls_view.forget(meeting_id)
+        partial_reports.forget(meeting_id)
         logger.info(f"Deleted meeting {meeting_id}")
         
         logger.info(f"Complete data cleanup finished for meeting {meeting_id}")
         
         # Return the PDF file
-        return FileResponse(
-            path=pdf_path,
-            filename=filename,
-            media_type='application/pdf',
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+        return pdf_response(pdf_bytes, filename)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating report for meeting {meeting_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating report: {str(e)}")
@@ -1304,6 +2955,11 @@ async def monitor_organizer_presence():
     """Background task to monitor organizer presence and handle leadership transfer/deletion"""
     while True:
         try:
+            # Un seul worker de tout le déploiement exécute la surveillance
+            if not await acquire_lease("organizer_presence_monitor", 90):
+                await asyncio.sleep(60)
+                continue
+            
             # Vérifier toutes les réunions actives
             active_meetings = await db.meetings.find({"status": "active"}).to_list(1000)
             
@@ -1320,8 +2976,9 @@ async def monitor_organizer_presence():
                     # Marquer l'organisateur comme absent
                     await db.meetings.update_one(
                         {"id": meeting_id},
-                        {"$set": {"organizer_present": False}}
+                        {"$set": {"organizer_present": False}, "$inc": {"revision": 1}}
                     )
+                    meeting_cache.invalidate(meeting_id)
                     
                     # Vérifier s'il y a des scrutateurs approuvés
                     approved_scrutators = await db.scrutators.find({
@@ -1334,8 +2991,9 @@ async def monitor_organizer_presence():
                         senior_scrutator = approved_scrutators[0]
                         await db.meetings.update_one(
                             {"id": meeting_id},
-                            {"$set": {"leadership_transferred_to": senior_scrutator["name"]}}
+                            {"$set": {"leadership_transferred_to": senior_scrutator["name"]}, "$inc": {"revision": 1}}
                         )
+                        meeting_cache.invalidate(meeting_id)
                         
                         # Notifier seulement les scrutateurs
                         await manager.send_to_meeting({
@@ -1358,14 +3016,15 @@ async def monitor_organizer_presence():
                         deletion_time = datetime.utcnow() + timedelta(hours=12)
                         await db.meetings.update_one(
                             {"id": meeting_id},
-                            {"$set": {"auto_deletion_scheduled": deletion_time}}
+                            {"$set": {"auto_deletion_scheduled": deletion_time}, "$inc": {"revision": 1}}
                         )
+                        meeting_cache.invalidate(meeting_id)
                 
                 # Vérifier si la suppression automatique doit avoir lieu
                 auto_deletion = meeting.get("auto_deletion_scheduled")
                 if auto_deletion and datetime.utcnow() >= auto_deletion:
                     # Vérifier s'il y a encore des connexions actives
-                    active_connections = len(manager.active_connections.get(meeting_id, []))
+                    active_connections = await count_meeting_connections(meeting_id)
                     
                     if active_connections == 0:
                         # Pas de connexions actives - supprimer la réunion
@@ -1376,8 +3035,9 @@ async def monitor_organizer_presence():
                         new_deletion_time = datetime.utcnow() + timedelta(hours=1)
                         await db.meetings.update_one(
                             {"id": meeting_id},
-                            {"$set": {"auto_deletion_scheduled": new_deletion_time}}
+                            {"$set": {"auto_deletion_scheduled": new_deletion_time}, "$inc": {"revision": 1}}
                         )
+                        meeting_cache.invalidate(meeting_id)
         
         except Exception as e:
             logger.error(f"Error in organizer presence monitoring: {str(e)}")
@@ -1404,24 +3064,95 @@ async def cleanup_meeting_data(meeting_id: str, reason: str):
         await db.scrutators.delete_many({"meeting_id": meeting_id})
         await db.recovery_sessions.delete_many({"meeting_id": meeting_id})
         await db.meetings.delete_one({"id": meeting_id})
+        meeting_cache.invalidate(meeting_id)
+        await meeting_events.forget(meeting_id)
+        participant_polls_view.forget(meeting_id)
+        partial_reports.forget(meeting_id)
         
         logger.info(f"Meeting {meeting_id} completely cleaned up due to {reason}")
         
     except Exception as e:
         logger.error(f"Error cleaning up meeting {meeting_id}: {str(e)}")
 
-# Start the background task
-asyncio.create_task(monitor_organizer_presence())
+async def report_worker_connections():
+    """Publier périodiquement le nombre de sockets ouvertes par réunion sur ce worker"""
+    while True:
+        try:
+            await db.ws_workers.update_one(
+                {"_id": WORKER_ID},
+                {"$set": {
+                    "connections": {mid: len(conns) for mid, conns in manager.active_connections.items() if conns},
+                    "updated_at": datetime.utcnow()
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error reporting worker connections: {str(e)}")
+        await asyncio.sleep(WORKER_HEARTBEAT_SECONDS)
+
+async def count_meeting_connections(meeting_id: str) -> int:
+    """Nombre de sockets ouvertes sur une réunion, tous workers confondus"""
+    if not CLUSTER_MODE:
+        return len(manager.active_connections.get(meeting_id, []))
+    
+    fresh_since = datetime.utcnow() - timedelta(seconds=WORKER_HEARTBEAT_SECONDS * 3)
+    pipeline = [
+        {"$match": {"updated_at": {"$gte": fresh_since}}},
+        {"$group": {"_id": None, "total": {"$sum": f"$connections.{meeting_id}"}}}
+    ]
+    async for row in db.ws_workers.aggregate(pipeline):
+        return row["total"]
+    return 0
+
+@app.on_event("startup")
+async def start_background_tasks():
+    await ensure_required_indexes()
+    await meeting_events.ensure_indexes()
+    await manager.broker.start(manager.deliver_local)
+    if CLUSTER_MODE:
+        background_tasks.append(asyncio.create_task(report_worker_connections()))
+    background_tasks.append(asyncio.create_task(monitor_organizer_presence()))
+    background_tasks.append(asyncio.create_task(manager.keepalive()))
+    logger.info(f"Worker {WORKER_ID} started (cluster mode: {CLUSTER_MODE}, broker: {WS_BROKER})")
 
 # WebSocket endpoint
 @app.websocket("/ws/meetings/{meeting_id}")
-async def websocket_endpoint(websocket: WebSocket, meeting_id: str):
-    await manager.connect(websocket, meeting_id)
+async def websocket_endpoint(websocket: WebSocket, meeting_id: str, role: ClientRole = ClientRole.PARTICIPANT, last_seq: Optional[int] = None):
+    connection = await manager.connect(websocket, meeting_id, role.value)
     try:
+        # Reprise : renvoyer uniquement les événements manqués depuis `last_seq`
+        # Au plus ce que la file peut contenir avec la trame `connected`, sinon resynchronisation
+        missed = await meeting_events.since(meeting_id, last_seq, WS_QUEUE_MAX_FRAMES - 1) if last_seq is not None else []
+        current_seq = await meeting_events.current_seq(meeting_id)
+        
+        # Les diffusions arrivées depuis `connect` sont retenues : celles que la reprise
+        # contient déjà (seq <= dernier rejoué) sont écartées, les autres suivent la reprise
+        queued = True
+        replayed_seq = None
+        if missed is None:
+            queued = connection.enqueue(encode_ws_message({"type": "resync_required", "seq": current_seq}))
+        else:
+            if last_seq is not None:
+                replayed_seq = last_seq
+            for message in missed:
+                replayed_seq = message.get("seq", replayed_seq)
+                payload = payload_for_role(message, connection.role)
+                if payload is not None and queued:
+                    queued = connection.enqueue(encode_ws_message(payload), tally_payload(payload))
+            connected_seq = replayed_seq if replayed_seq is not None else current_seq
+            queued = queued and connection.enqueue(encode_ws_message({"type": "connected", "seq": connected_seq}))
+        queued = queued and connection.release(replayed_seq)
+        if not queued:
+            await manager.evict(connection, meeting_id)
+            return
+        
         while True:
             await websocket.receive_text()
+            connection.mark_seen()
     except WebSocketDisconnect:
-        manager.disconnect(websocket, meeting_id)
+        pass
+    finally:
+        manager.disconnect(connection, meeting_id)
 
 # Health check endpoint for production
 @app.get("/api/health")
@@ -1436,12 +3167,27 @@ async def health_check():
             "services": {
                 "database": "connected",
                 "api": "running"
-            }
+            },
+            "missing_indexes": await find_missing_indexes()
         }
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
+@app.get("/api/metrics")
+async def metrics():
+    """Métriques internes du serveur (votes, cache des réunions, WebSockets)"""
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "vote_ingestion": vote_ingestion.metrics(),
+        "vote_broadcasts": vote_broadcasts.metrics(),
+        "meeting_cache": meeting_cache.metrics(),
+        "participant_polls_view": participant_polls_view.metrics(),
+        "reports": report_renderer.metrics(),
+        "partial_reports": partial_reports.metrics(),
+        "websockets": manager.metrics()
+    }
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -1464,4 +3210,13 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    # Écrire les bulletins encore en file avant de fermer la connexion
+    await vote_ingestion.stop()
+    report_renderer.shutdown()
+    await manager.drain()
+    await manager.broker.stop()
+    for task in background_tasks:
+        task.cancel()
+    if CLUSTER_MODE:
+        await db.ws_workers.delete_one({"_id": WORKER_ID})
     client.close()
\ No newline at end of file
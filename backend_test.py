@@ -1380,6 +1380,428 @@ class VoteSecretAPITester:
             self.log_test("WebSocket Report Notifications", False, f"Error: {str(e)}")
             return False
             
+    async def create_live_poll(self, title: str, options=("Pour", "Contre")):
+        """Create a dedicated meeting with one started poll (keeps real-time tests independent)"""
+        async with self.session.post(
+            f"{API_BASE_URL}/meetings",
+            json={"title": title, "organizer_name": "Realtime Test Organizer"}
+        ) as response:
+            if response.status != 200:
+                return None, None
+            meeting = await response.json()
+            
+        async with self.session.post(
+            f"{API_BASE_URL}/meetings/{meeting['id']}/polls",
+            json={"question": f"{title} ?", "options": list(options)}
+        ) as response:
+            if response.status != 200:
+                return meeting, None
+            poll = await response.json()
+            
+        async with self.session.post(f"{API_BASE_URL}/polls/{poll['id']}/start") as response:
+            if response.status != 200:
+                return meeting, None
+        return meeting, poll
+        
+    async def join_participant(self, meeting: Dict[str, Any], name: str):
+        async with self.session.post(
+            f"{API_BASE_URL}/participants/join",
+            json={"name": name, "meeting_code": meeting["meeting_code"]}
+        ) as response:
+            return await response.json() if response.status == 200 else None
+            
+    async def receive_until(self, websocket, message_type: str, timeout: float = 5.0):
+        """Read WebSocket messages until one of `message_type` arrives; returns (message, all messages read)"""
+        received = []
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, received
+            try:
+                message = json.loads(await asyncio.wait_for(websocket.recv(), timeout=remaining))
+            except asyncio.TimeoutError:
+                return None, received
+            received.append(message)
+            if message.get("type") == message_type:
+                return message, received
+                
+    async def test_meeting_changes(self):
+        """Test 31: Incremental Meeting Changes (/changes)"""
+        try:
+            meeting, poll = await self.create_live_poll("Changes Test Meeting")
+            if not poll:
+                self.log_test("Meeting Changes", False, "Failed to create test meeting")
+                return False
+                
+            async with self.session.get(f"{API_BASE_URL}/meetings/{meeting['id']}/changes") as response:
+                full = await response.json()
+            if not (full.get("changed") and full.get("full") and len(full["polls"]) == 1):
+                self.log_test("Meeting Changes", False, f"Unexpected full state: {full}")
+                return False
+                
+            participant = await self.join_participant(meeting, "Changes Participant")
+            async with self.session.get(
+                f"{API_BASE_URL}/meetings/{meeting['id']}/changes",
+                params={"since": full["revision"]}
+            ) as response:
+                delta = await response.json()
+                
+            # Le delta contient exactement le participant ajouté, jamais une révision sans son changement
+            if (delta.get("full") or delta["revision"] <= full["revision"]
+                    or [p["id"] for p in delta["participants"]] != [participant["id"]] or delta["polls"]):
+                self.log_test("Meeting Changes", False, f"Unexpected delta: {delta}")
+                return False
+                
+            async with self.session.get(
+                f"{API_BASE_URL}/meetings/{meeting['id']}/changes",
+                params={"since": delta["revision"]}
+            ) as response:
+                unchanged = await response.json()
+            async with self.session.get(
+                f"{API_BASE_URL}/meetings/{meeting['id']}/changes",
+                params={"since": delta["revision"] + 1000}
+            ) as response:
+                unknown = await response.json()
+                
+            if unchanged != {"revision": delta["revision"], "changed": False}:
+                self.log_test("Meeting Changes", False, f"Expected no changes, got: {unchanged}")
+                return False
+            if not unknown.get("full"):
+                self.log_test("Meeting Changes", False, "Unknown revision should return the full state")
+                return False
+                
+            self.log_test("Meeting Changes", True,
+                        f"Full state at revision {full['revision']}, delta of 1 participant at {delta['revision']}")
+            return True
+            
+        except Exception as e:
+            self.log_test("Meeting Changes", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_organizer_view_etag(self):
+        """Test 32: Organizer View Conditional Requests (ETag / 304)"""
+        try:
+            meeting, poll = await self.create_live_poll("Organizer ETag Test Meeting")
+            if not poll:
+                self.log_test("Organizer View ETag", False, "Failed to create test meeting")
+                return False
+                
+            url = f"{API_BASE_URL}/meetings/{meeting['id']}/organizer"
+            async with self.session.get(url) as response:
+                etag = response.headers.get("ETag")
+            if not etag:
+                self.log_test("Organizer View ETag", False, "No ETag on organizer view")
+                return False
+                
+            async with self.session.get(url, headers={"If-None-Match": etag}) as response:
+                not_modified_status = response.status
+                
+            await self.join_participant(meeting, "ETag Participant")
+            async with self.session.get(url, headers={"If-None-Match": etag}) as response:
+                modified_status = response.status
+                new_etag = response.headers.get("ETag")
+                
+            if not_modified_status != 304 or modified_status != 200 or new_etag == etag:
+                self.log_test("Organizer View ETag", False,
+                            f"Expected 304 then 200 with a new ETag, got {not_modified_status}, {modified_status}")
+                return False
+                
+            self.log_test("Organizer View ETag", True, "304 while unchanged, new ETag after a join")
+            return True
+            
+        except Exception as e:
+            self.log_test("Organizer View ETag", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_participant_polls_etag(self):
+        """Test 33: Participant Polls ETag Only Changes With Polls"""
+        try:
+            meeting, poll = await self.create_live_poll("Participant ETag Test Meeting")
+            if not poll:
+                self.log_test("Participant Polls ETag", False, "Failed to create test meeting")
+                return False
+                
+            url = f"{API_BASE_URL}/meetings/{meeting['id']}/polls/participant"
+            async with self.session.get(url) as response:
+                etag = response.headers.get("ETag")
+                
+            # Une arrivée de participant ne touche pas à la vue des sondages
+            await self.join_participant(meeting, "Participant ETag Joiner")
+            async with self.session.get(url, headers={"If-None-Match": etag}) as response:
+                after_join = response.status
+                
+            async with self.session.post(f"{API_BASE_URL}/polls/{poll['id']}/close") as response:
+                pass
+            async with self.session.get(url, headers={"If-None-Match": etag}) as response:
+                after_close = response.status
+                polls = await response.json() if after_close == 200 else []
+                
+            if after_join != 304 or after_close != 200 or polls[0]["status"] != "closed":
+                self.log_test("Participant Polls ETag", False,
+                            f"Expected 304 after join and 200 after close, got {after_join}, {after_close}")
+                return False
+                
+            self.log_test("Participant Polls ETag", True, "304 across a join, 200 once the poll closed")
+            return True
+            
+        except Exception as e:
+            self.log_test("Participant Polls ETag", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_participant_updates_long_poll(self):
+        """Test 34: Participant Long-Poll (/updates)"""
+        try:
+            meeting, poll = await self.create_live_poll("Long-Poll Test Meeting")
+            participant = await self.join_participant(meeting, "Long-Poll Participant") if poll else None
+            if not participant:
+                self.log_test("Participant Long-Poll", False, "Failed to create test meeting")
+                return False
+                
+            url = f"{API_BASE_URL}/participants/{participant['id']}/updates"
+            async with self.session.get(url) as response:
+                first = await response.json()
+            if not (first.get("changed") and first.get("status") == "pending" and len(first.get("polls", [])) == 1):
+                self.log_test("Participant Long-Poll", False, f"Unexpected first response: {first}")
+                return False
+                
+            params = {"since": first["revision"], "status": first["status"], "timeout": 2}
+            
+            async def wait_for_update():
+                started = time.monotonic()
+                async with self.session.get(url, params=params) as response:
+                    return time.monotonic() - started, await response.json()
+                    
+            async def after_delay(action):
+                await asyncio.sleep(0.5)
+                return await action()
+                
+            # L'arrivée d'un autre participant ne libère pas l'attente
+            (elapsed, unrelated), _ = await asyncio.gather(
+                wait_for_update(), after_delay(lambda: self.join_participant(meeting, "Other Participant"))
+            )
+            if unrelated.get("changed") or elapsed < 1.5:
+                self.log_test("Participant Long-Poll", False,
+                            f"Released by another participant's join after {elapsed:.1f}s: {unrelated}")
+                return False
+                
+            async def approve():
+                async with self.session.post(
+                    f"{API_BASE_URL}/participants/{participant['id']}/approve",
+                    json={"participant_id": participant["id"], "approved": True}
+                ) as response:
+                    return response.status
+                    
+            # Sa propre validation la libère aussitôt
+            (elapsed, approved), _ = await asyncio.gather(wait_for_update(), after_delay(approve))
+            if not approved.get("changed") or approved.get("status") != "approved" or elapsed >= 1.5:
+                self.log_test("Participant Long-Poll", False, f"Approval not delivered promptly: {approved}")
+                return False
+                
+            self.log_test("Participant Long-Poll", True,
+                        f"Held across another join, released by own approval in {elapsed:.2f}s")
+            return True
+            
+        except Exception as e:
+            self.log_test("Participant Long-Poll", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_vote_submitted_payload(self):
+        """Test 35: vote_submitted WebSocket Payload Per Role"""
+        try:
+            meeting, poll = await self.create_live_poll("Vote Payload Test Meeting")
+            if not poll:
+                self.log_test("Vote Submitted Payload", False, "Failed to create test meeting")
+                return False
+                
+            ws_url = BACKEND_URL.replace('https://', 'wss://').replace('http://', 'ws://')
+            base_url = f"{ws_url}/ws/meetings/{meeting['id']}"
+            option = poll["options"][0]
+            
+            async with websockets.connect(f"{base_url}?role=organizer") as organizer_ws, \
+                    websockets.connect(f"{base_url}?role=participant") as participant_ws:
+                await self.receive_until(organizer_ws, "connected")
+                await self.receive_until(participant_ws, "connected")
+                
+                async with self.session.post(
+                    f"{API_BASE_URL}/votes",
+                    json={"poll_id": poll["id"], "option_id": option["id"]}
+                ) as response:
+                    if response.status != 200:
+                        self.log_test("Vote Submitted Payload", False, f"Vote failed: HTTP {response.status}")
+                        return False
+                        
+                organizer_message, _ = await self.receive_until(organizer_ws, "vote_submitted")
+                participant_message, _ = await self.receive_until(participant_ws, "vote_submitted")
+                
+            # Décompte par option pour l'organisateur (sans le sondage complet), total seul pour les participants
+            counts = {o["id"]: o["votes"] for o in (organizer_message or {}).get("options", [])}
+            if (not organizer_message or organizer_message.get("poll_id") != poll["id"]
+                    or counts.get(option["id"]) != 1 or sum(counts.values()) != 1
+                    or organizer_message.get("total_votes") != 1 or "poll" in organizer_message):
+                self.log_test("Vote Submitted Payload", False, f"Unexpected organizer payload: {organizer_message}")
+                return False
+            if (not participant_message or participant_message.get("total_votes") != 1
+                    or "options" in participant_message or "poll" in participant_message):
+                self.log_test("Vote Submitted Payload", False, f"Unexpected participant payload: {participant_message}")
+                return False
+                
+            self.log_test("Vote Submitted Payload", True,
+                        "Organizer gets {poll_id, options, total_votes}, participant gets the total only")
+            return True
+            
+        except Exception as e:
+            self.log_test("Vote Submitted Payload", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_close_poll_flushes_tally(self):
+        """Test 36: Closing a Poll Broadcasts the Final Tally First"""
+        try:
+            meeting, poll = await self.create_live_poll("Tally Flush Test Meeting")
+            if not poll:
+                self.log_test("Close Poll Flushes Tally", False, "Failed to create test meeting")
+                return False
+                
+            ws_url = BACKEND_URL.replace('https://', 'wss://').replace('http://', 'ws://')
+            async with websockets.connect(f"{ws_url}/ws/meetings/{meeting['id']}?role=organizer") as websocket:
+                await self.receive_until(websocket, "connected")
+                
+                # Plusieurs bulletins puis clôture immédiate, avant la prochaine diffusion groupée
+                for option in (poll["options"][0], poll["options"][0], poll["options"][1]):
+                    async with self.session.post(
+                        f"{API_BASE_URL}/votes",
+                        json={"poll_id": poll["id"], "option_id": option["id"]}
+                    ) as response:
+                        if response.status != 200:
+                            self.log_test("Close Poll Flushes Tally", False, f"Vote failed: HTTP {response.status}")
+                            return False
+                async with self.session.post(f"{API_BASE_URL}/polls/{poll['id']}/close") as response:
+                    pass
+                    
+                closed, messages = await self.receive_until(websocket, "poll_closed")
+                
+            tallies = [m for m in messages if m.get("type") == "vote_submitted"]
+            if not closed or not tallies or tallies[-1]["total_votes"] != 3:
+                self.log_test("Close Poll Flushes Tally", False,
+                            f"Final tally missing before poll_closed: {[m.get('type') for m in messages]}")
+                return False
+                
+            self.log_test("Close Poll Flushes Tally", True,
+                        f"{len(tallies)} tally broadcast(s), last total 3 before poll_closed")
+            return True
+            
+        except Exception as e:
+            self.log_test("Close Poll Flushes Tally", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_websocket_replay(self):
+        """Test 37: WebSocket Reconnect Replays Missed Events Once, In Order"""
+        try:
+            meeting, poll = await self.create_live_poll("Replay Test Meeting")
+            if not poll:
+                self.log_test("WebSocket Replay", False, "Failed to create test meeting")
+                return False
+                
+            ws_url = BACKEND_URL.replace('https://', 'wss://').replace('http://', 'ws://')
+            base_url = f"{ws_url}/ws/meetings/{meeting['id']}?role=organizer"
+            async with websockets.connect(base_url) as websocket:
+                connected, _ = await self.receive_until(websocket, "connected")
+            last_seq = connected["seq"]
+            
+            # Événements manqués pendant la déconnexion
+            for i in range(3):
+                await self.join_participant(meeting, f"Missed Participant {i}")
+                
+            async with websockets.connect(f"{base_url}&last_seq={last_seq}") as websocket:
+                # D'autres événements arrivent pendant la reprise
+                joins = asyncio.gather(*[
+                    self.join_participant(meeting, f"Live Participant {i}") for i in range(3)
+                ])
+                _, messages = await self.receive_until(websocket, "__none__", timeout=3.0)
+                await joins
+                
+            seqs = [m["seq"] for m in messages if m.get("type") != "connected"]
+            replayed = [m for m in messages if m.get("type") == "participant_joined"]
+            connected_again = [m for m in messages if m.get("type") == "connected"]
+            if seqs[:3] != [last_seq + 1, last_seq + 2, last_seq + 3]:
+                self.log_test("WebSocket Replay", False, f"Missed events not replayed first: {seqs}")
+                return False
+            if seqs != sorted(set(seqs)) or len(replayed) != 6 or len(connected_again) != 1:
+                self.log_test("WebSocket Replay", False, f"Duplicated or out-of-order events: {seqs}")
+                return False
+                
+            self.log_test("WebSocket Replay", True, f"Replayed seq {seqs[0]}-{seqs[2]}, then live events {seqs[3:]}")
+            return True
+            
+        except Exception as e:
+            self.log_test("WebSocket Replay", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_websocket_resync_required(self):
+        """Test 38: WebSocket Reconnect Beyond the Journal Asks for a Resync"""
+        try:
+            meeting, poll = await self.create_live_poll("Resync Test Meeting")
+            if not poll:
+                self.log_test("WebSocket Resync", False, "Failed to create test meeting")
+                return False
+                
+            ws_url = BACKEND_URL.replace('https://', 'wss://').replace('http://', 'ws://')
+            # Un numéro inconnu du journal ne peut pas être rejoué
+            async with websockets.connect(
+                f"{ws_url}/ws/meetings/{meeting['id']}?role=organizer&last_seq=1000000"
+            ) as websocket:
+                message = json.loads(await asyncio.wait_for(websocket.recv(), timeout=5.0))
+                
+            if message.get("type") != "resync_required":
+                self.log_test("WebSocket Resync", False, f"Expected resync_required, got: {message}")
+                return False
+                
+            self.log_test("WebSocket Resync", True, "Unknown last_seq answered with resync_required")
+            return True
+            
+        except Exception as e:
+            self.log_test("WebSocket Resync", False, f"Error: {str(e)}")
+            return False
+            
+    async def test_reconcile_tallies(self):
+        """Test 39: Reconcile Poll Tallies Against Ballots"""
+        try:
+            meeting, poll = await self.create_live_poll("Reconcile Test Meeting")
+            if not poll:
+                self.log_test("Reconcile Tallies", False, "Failed to create test meeting")
+                return False
+                
+            for option in (poll["options"][0], poll["options"][1], poll["options"][1]):
+                async with self.session.post(
+                    f"{API_BASE_URL}/votes",
+                    json={"poll_id": poll["id"], "option_id": option["id"]}
+                ) as response:
+                    pass
+            async with self.session.post(f"{API_BASE_URL}/polls/{poll['id']}/close") as response:
+                pass
+                
+            async with self.session.post(f"{API_BASE_URL}/meetings/{meeting['id']}/reconcile-tallies") as response:
+                if response.status != 200:
+                    self.log_test("Reconcile Tallies", False, f"HTTP {response.status}: {await response.text()}")
+                    return False
+                data = await response.json()
+            async with self.session.post(f"{API_BASE_URL}/meetings/unknown-meeting/reconcile-tallies") as response:
+                unknown_status = response.status
+                
+            if data.get("polls_checked") != 1 or data.get("discrepancies") != [] or data.get("repaired") != 0:
+                self.log_test("Reconcile Tallies", False, f"Counters drifted from ballots: {data}")
+                return False
+            if unknown_status != 404:
+                self.log_test("Reconcile Tallies", False, f"Expected 404 for an unknown meeting, got {unknown_status}")
+                return False
+                
+            self.log_test("Reconcile Tallies", True, "Counters match ballots, nothing to repair")
+            return True
+            
+        except Exception as e:
+            self.log_test("Reconcile Tallies", False, f"Error: {str(e)}")
+            return False
+            
     async def run_all_tests(self):
         """Run all backend API tests"""
         print("🚀 Starting Vote Secret Backend API Tests")
@@ -1430,6 +1852,16 @@ class VoteSecretAPITester:
                 self.test_websocket_report_notifications,
                 # WEBSOCKET TEST
                 self.test_websocket_connection,
+                # REAL-TIME SYNC TESTS
+                self.test_meeting_changes,
+                self.test_organizer_view_etag,
+                self.test_participant_polls_etag,
+                self.test_participant_updates_long_poll,
+                self.test_vote_submitted_payload,
+                self.test_close_poll_flushes_tally,
+                self.test_websocket_replay,
+                self.test_websocket_resync_required,
+                self.test_reconcile_tallies,
             ]
             
             passed = 0
@@ -127,7 +127,7 @@ function App() {
       
       setMeeting(response.data.meeting);
       setCurrentView("organizer");
-      connectWebSocket(response.data.meeting.id);
+      connectWebSocket(response.data.meeting.id, "organizer");
       setShowRecoveryModal(false);
       
       alert("Accès récupéré avec succès !");
@@ -392,7 +392,7 @@ function App() {
         console.log("✅ Meeting created successfully:", response.data);
         setMeeting(response.data);
         setCurrentView("organizer");
-        connectWebSocket(response.data.id);
+        connectWebSocket(response.data.id, "organizer");
       } catch (error) {
         console.error("❌ Error creating meeting:", error);
         alert("Erreur lors de la création de la réunion: " + (error.response?.data?.detail || error.message));
@@ -515,7 +515,7 @@ function App() {
               setIsScrutator(true);
               setScrutatorName(name);
               setCurrentView("organizer");
-              connectWebSocket(response.data.meeting.id);
+              connectWebSocket(response.data.meeting.id, "scrutator");
               
               alert(`✅ Connexion réussie en tant que scrutateur !\n\nBonjour ${name}, vous avez maintenant accès à l'interface organisateur pour surveiller la réunion "${response.data.meeting.title}".`);
             } else if (response.data.status === "pending_approval") {
@@ -550,7 +550,7 @@ function App() {
           setMeeting(meetingResponse.data);
           
           setCurrentView("participant");
-          connectWebSocket(meetingResponse.data.id);
+          connectWebSocket(meetingResponse.data.id, "participant");
         }
       } catch (error) {
         console.error("❌ Error joining meeting:", error);
@@ -1834,16 +1834,45 @@ function App() {
 
     useEffect(() => {
       if (participant) {
-        checkParticipantStatus();
-        loadPolls();
+        // Annulé au démontage : la requête en attente est interrompue côté navigateur
+        const controller = new AbortController();
+        let revision = null;
+        let knownStatus = null;
         
-        // Set up polling for participant status and polls
-        const interval = setInterval(() => {
-          checkParticipantStatus();
-          loadPolls();
-        }, 3000);
+        // Long-poll : le serveur ne répond que lorsque le statut ou les sondages changent
+        const waitForUpdates = async () => {
+          while (!controller.signal.aborted) {
+            try {
+              const response = await axios.get(`${API}/participants/${participant.id}/updates`, {
+                params: revision === null ? {} : { since: revision, status: knownStatus },
+                signal: controller.signal
+              });
+              if (controller.signal.aborted) break;
+              revision = response.data.revision;
+              if (response.data.changed) {
+                knownStatus = response.data.status;
+                setStatus(response.data.status);
+                setPolls(response.data.polls);
+              }
+            } catch (error) {
+              if (controller.signal.aborted || axios.isCancel(error)) break;
+              console.error("Error waiting for updates:", error);
+              
+              // If we get a 404, the meeting has been deleted
+              if (error.response?.status === 404) {
+                handleMeetingClosed();
+                break;
+              }
+              await new Promise((resolve) => setTimeout(resolve, 3000));
+            }
+          }
+        };
         
-        return () => clearInterval(interval);
+        waitForUpdates();
+        
+        return () => {
+          controller.abort();
+        };
       }
     }, [participant]);
 
@@ -1866,20 +1895,6 @@ function App() {
       }
     }, [meetingClosed, redirectCountdown, setCurrentView, setMeeting, setParticipant, setMeetingClosed, setClosedMeetingInfo, setRedirectCountdown]);
 
-    const checkParticipantStatus = async () => {
-      try {
-        const response = await axios.get(`${API}/participants/${participant.id}/status`);
-        setStatus(response.data.status);
-      } catch (error) {
-        console.error("Error checking status:", error);
-        
-        // If we get a 404, the meeting might have been deleted
-        if (error.response?.status === 404) {
-          handleMeetingClosed();
-        }
-      }
-    };
-
     const loadPolls = async () => {
       if (!meeting) return;
       try {
@@ -2289,19 +2304,46 @@ function App() {
   };
 
   // WebSocket connection
-  const connectWebSocket = (meetingId) => {
-    const wsUrl = `${BACKEND_URL.replace('https://', 'wss://').replace('http://', 'ws://')}/ws/meetings/${meetingId}`;
+  // Après une coupure (éviction 1013, socket morte, réseau), la reconnexion transmet
+  // le dernier `seq` reçu : le serveur renvoie uniquement les événements manqués.
+  const connectWebSocket = (meetingId, role = "participant", lastSeq = null, retries = 0) => {
+    const resume = lastSeq !== null ? `&last_seq=${lastSeq}` : "";
+    const wsUrl = `${BACKEND_URL.replace('https://', 'wss://').replace('http://', 'ws://')}/ws/meetings/${meetingId}?role=${role}${resume}`;
     const websocket = new WebSocket(wsUrl);
+    let seq = lastSeq;
+    let meetingEnded = false;
     
     websocket.onopen = () => {
       console.log("WebSocket connected");
+      retries = 0;
       setWs(websocket);
     };
     
     websocket.onmessage = (event) => {
       const data = JSON.parse(event.data);
+      
+      // Keepalive : répondre au ping du serveur, sinon la socket est fermée
+      if (data.type === "ping") {
+        websocket.send(JSON.stringify({ type: "pong" }));
+        return;
+      }
+      
+      if (typeof data.seq === "number" && (seq === null || data.seq > seq)) {
+        seq = data.seq;
+      }
+      
       console.log("WebSocket message:", data);
       
+      if (data.type === "resync_required") {
+        // Trop d'événements manqués pour une reprise : recharger l'état complet
+        window.location.reload();
+        return;
+      }
+      
+      if (data.type === "meeting_closed" || data.type === "meeting_auto_deleted") {
+        meetingEnded = true;
+      }
+      
       // Handle real-time updates based on message type
       if (data.type === "participant_joined" || data.type === "participant_approved") {
         // Refresh participant list for organizer
@@ -2320,11 +2362,16 @@ function App() {
       // Suppression de toute la logique WebSocket des votes scrutateurs
       // Plus nécessaire avec génération directe des rapports
       
-      if (data.type === "poll_started" || data.type === "poll_closed" || data.type === "vote_submitted") {
+      if (data.type === "poll_started" || data.type === "poll_closed") {
         // Refresh polls for both organizer and participants
         window.location.reload(); // Simple refresh for now
       }
       
+      if (data.type === "vote_submitted" && role !== "participant") {
+        // Les participants ne reçoivent que le total, déjà rafraîchi par leur polling
+        window.location.reload(); // Simple refresh for now
+      }
+      
       if (data.type === "leadership_transferred") {
         // Leadership transferred to scrutator
         if (isScrutator && scrutatorName === data.new_leader) {
@@ -2377,6 +2424,12 @@ function App() {
     websocket.onclose = () => {
       console.log("WebSocket disconnected");
       setWs(null);
+      if (meetingEnded) {
+        return;
+      }
+      // Reconnexion avec attente croissante (1 s, 2 s, 4 s... jusqu'à 30 s)
+      const delay = Math.min(1000 * 2 ** retries, 30000);
+      setTimeout(() => connectWebSocket(meetingId, role, seq, retries + 1), delay);
     };
   };
 
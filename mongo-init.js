@@ -10,6 +10,7 @@ db.createCollection('scrutators');
 db.createCollection('scrutator_access');
 
 // Create indexes for better performance
+// (the backend also creates every index it relies on at startup, see REQUIRED_INDEXES in server.py)
 db.meetings.createIndex({ "meeting_code": 1 }, { unique: true });
 db.meetings.createIndex({ "created_at": 1 });
 db.meetings.createIndex({ "status": 1 });